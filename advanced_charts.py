@@ -3,13 +3,377 @@ Advanced visualization module using Plotly for the Log Analyzer application.
 """
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union, Any, Tuple
 
+from charts import _section_selector
 from config import CHART_WIDTH, CHART_HEIGHT, COLOR_SCHEME, DEFAULT_LOG_TYPE
-from utils import get_time_periods
+from utils import frame_identity, get_time_periods, status_class_categorical
+
+# Try to import plotly-resampler, but make it optional
+try:
+    from plotly_resampler import FigureResampler
+    from plotly_resampler.aggregation import LTTB
+    RESAMPLER_AVAILABLE = True
+except ImportError:
+    RESAMPLER_AVAILABLE = False
+
+# Try to import pyarrow, but make it optional
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Try to import numba, but make it optional
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Maximum number of points per trace sent to the browser
+MAX_SHOWN_SAMPLES = 2000
+
+# Above this many log entries, hover is disabled on heavy charts
+HOVER_POINT_LIMIT = 50000
+
+# Per-user heatmaps shown side by side in one faceted figure
+HEATMAP_FACET_COLUMNS = 3
+
+# Number of bins in the spam score histogram
+SPAM_HISTOGRAM_BINS = 50
+
+# Cache settings for filtered data and aggregates
+CACHE_TTL = 600
+CACHE_MAX_ENTRIES = 32
+AGGREGATE_CACHE_ENTRIES = 256
+
+def downsample_figure(fig: go.Figure) -> go.Figure:
+    """
+    Downsample long line/scatter traces with LTTB before rendering.
+
+    Args:
+        fig: Plotly figure to downsample
+
+    Returns:
+        go.Figure: Resampled figure, or the original figure if plotly-resampler is unavailable
+    """
+    if not RESAMPLER_AVAILABLE:
+        return fig
+
+    return FigureResampler(fig, default_n_shown_samples=MAX_SHOWN_SAMPLES, default_downsampler=LTTB())
+
+# Day names in calendar order (dt.dayofweek 0..6)
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Columns the browsing charts are counted over (status_class is derived from status_code)
+BROWSING_GROUP_COLUMNS = ['username', 'date', 'day_of_week', 'hour', 'status_code', 'category']
+
+# Low-cardinality columns stored as categoricals, per log type
+CATEGORICAL_COLUMNS = {
+    'browsing': ['username', 'category', 'status_class'],
+    'virus': ['severity', 'action_taken', 'virus_name'],
+    'mail': ['status'],
+}
+
+def _accumulate_heatmaps_numpy(users: np.ndarray, days: np.ndarray, hours: np.ndarray,
+                               weights: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Add weighted (user, day, hour) counts into out; rows with user -1 are skipped."""
+    valid = users >= 0
+    np.add.at(out, (users[valid], days[valid], hours[valid]), weights[valid])
+    return out
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _accumulate_heatmaps(users, days, hours, weights, out):
+        """Add weighted (user, day, hour) counts into out; rows with user -1 are skipped."""
+        for i in range(users.size):
+            if users[i] >= 0:
+                out[users[i], days[i], hours[i]] += weights[i]
+        return out
+else:
+    _accumulate_heatmaps = _accumulate_heatmaps_numpy
+
+def user_activity_heatmaps(user_time_counts: pd.DataFrame, users: List[str]) -> np.ndarray:
+    """
+    Build day-of-week by hour activity matrices for a list of users.
+
+    Args:
+        user_time_counts: DataFrame with 'username', 'day_of_week', 'hour' and 'count' columns
+        users: Users to build matrices for
+
+    Returns:
+        np.ndarray: Array of shape (len(users), 7, 24) with request counts
+    """
+    user_codes = pd.Categorical(user_time_counts['username'], categories=users).codes.astype(np.int64)
+    day_codes = pd.Categorical(user_time_counts['day_of_week'], categories=DAY_ORDER).codes.astype(np.int64)
+    hours = user_time_counts['hour'].to_numpy(dtype=np.int64)
+    weights = user_time_counts['count'].to_numpy(dtype=np.int64)
+
+    out = np.zeros((len(users), len(DAY_ORDER), 24), dtype=np.int64)
+    return _accumulate_heatmaps(user_codes, day_codes, hours, weights, out)
+
+def prepare_log_data(df: pd.DataFrame, log_type: str) -> pd.DataFrame:
+    """
+    Convert log columns to compact dtypes for filtering and grouping.
+
+    Low-cardinality columns of the log type become categoricals; remaining
+    text columns become Arrow-backed strings when pyarrow is installed.
+
+    Args:
+        df: DataFrame containing log data
+        log_type: Type of log data
+
+    Returns:
+        pd.DataFrame: DataFrame with converted columns
+    """
+    df = df.copy()
+    categorical_columns = CATEGORICAL_COLUMNS.get(log_type, [])
+    for column in categorical_columns:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype('category')
+
+    if PYARROW_AVAILABLE:
+        for column in df.columns:
+            if (column not in categorical_columns and df[column].dtype == object
+                    and pd.api.types.infer_dtype(df[column], skipna=True) == 'string'):
+                df[column] = df[column].astype('string[pyarrow]')
+    return df
+
+def _session_prepared_data(log_type: str) -> pd.DataFrame:
+    """
+    Get the session's log data prepared by prepare_log_data, converting it once per load.
+
+    The prepared frame is kept in the session's own state rather than a process-wide
+    cache, so it is never shared between users, and it keeps a stable identity across
+    reruns for the cached filters keyed by frame_identity.
+
+    Args:
+        log_type: Type of log data
+
+    Returns:
+        pd.DataFrame: Prepared copy of st.session_state.log_data
+    """
+    log_data = st.session_state.log_data
+    key = (st.session_state.get('log_data_version', 0), id(log_data), log_type)
+    cached = st.session_state.get('prepared_log_data')
+    if cached is None or cached[0] != key:
+        cached = st.session_state.prepared_log_data = (key, prepare_log_data(log_data, log_type))
+    return cached[1]
+
+def add_time_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add hour, day of week and date columns derived from the datetime column.
+
+    Args:
+        df: DataFrame with a 'datetime' column
+
+    Returns:
+        pd.DataFrame: DataFrame with 'hour', 'day_of_week' and 'date' columns
+    """
+    dt = df['datetime'].dt
+    return df.assign(
+        hour=dt.hour.astype('int8'),
+        day_of_week=pd.Categorical.from_codes(dt.dayofweek.to_numpy(dtype=np.int8), categories=DAY_ORDER, ordered=True),
+        date=dt.normalize()
+    )
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False,
+               hash_funcs={pd.DataFrame: frame_identity})
+def filter_options(df: pd.DataFrame, column: str) -> List[Any]:
+    """
+    Get the values offered by a sidebar filter.
+
+    Args:
+        df: DataFrame containing log data
+        column: Column to list values for
+
+    Returns:
+        List: Category labels for categorical columns, otherwise the sorted unique values
+    """
+    if isinstance(df[column].dtype, pd.CategoricalDtype):
+        return df[column].cat.categories.tolist()
+    return sorted(df[column].dropna().unique().tolist())
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False,
+               hash_funcs={pd.DataFrame: frame_identity})
+def filter_log_data(df: pd.DataFrame, start_datetime: pd.Timestamp, end_datetime: pd.Timestamp,
+                    selections: Tuple[Tuple[str, Tuple], ...] = (),
+                    spam_range: Optional[Tuple[float, float]] = None) -> pd.DataFrame:
+    """
+    Apply the sidebar filters to the log data.
+
+    Args:
+        df: DataFrame containing log data
+        start_datetime: Start of the date range
+        end_datetime: End of the date range
+        selections: (column, selected values) pairs; empty selections are ignored
+        spam_range: Optional (min, max) spam score range
+
+    Returns:
+        pd.DataFrame: Filtered DataFrame with derived time columns
+    """
+    # Build every condition first, then index the frame once
+    masks = []
+
+    if 'datetime' in df.columns:
+        timestamps = df['datetime']
+        if isinstance(timestamps.dtype, np.dtype) and timestamps.is_monotonic_increasing:
+            # Logs are usually in time order: slice the date range by binary search
+            values = timestamps.to_numpy()
+            lo = np.searchsorted(values, start_datetime.to_datetime64(), side='left')
+            hi = np.searchsorted(values, end_datetime.to_datetime64(), side='right')
+            df = df.iloc[lo:hi]
+        else:
+            masks.append((timestamps >= start_datetime).to_numpy())
+            masks.append((timestamps <= end_datetime).to_numpy())
+
+    for column, selected in selections:
+        if selected and column in df.columns:
+            masks.append(df[column].isin(selected).to_numpy())
+
+    if spam_range is not None and 'spam_score' in df.columns:
+        masks.append((df['spam_score'] >= spam_range[0]).to_numpy())
+        masks.append((df['spam_score'] <= spam_range[1]).to_numpy())
+
+    filtered_df = df[np.logical_and.reduce(masks)] if masks else df
+
+    if 'datetime' in filtered_df.columns:
+        return add_time_columns(filtered_df)
+
+    return filtered_df.copy()
+
+def count_values(series: pd.Series, sort_by_count: bool = True) -> pd.DataFrame:
+    """
+    Count occurrences of each value in a column.
+
+    Args:
+        series: Column to count
+        sort_by_count: Sort by descending count if True, otherwise by value
+
+    Returns:
+        pd.DataFrame: DataFrame with the value column and a 'count' column
+    """
+    counts = series.value_counts(sort=sort_by_count)
+    counts = counts[counts > 0]  # Drop unobserved categories
+    if not sort_by_count:
+        counts = counts.sort_index()
+    return counts.rename_axis(series.name).reset_index(name='count')
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=AGGREGATE_CACHE_ENTRIES, show_spinner=False)
+def cached_count_values(_df: pd.DataFrame, cache_key: Tuple, column: str, sort_by_count: bool = True) -> pd.DataFrame:
+    """
+    Cached count_values for a column of the filtered data.
+
+    Args:
+        _df: Filtered DataFrame (not hashed)
+        cache_key: Key identifying the data and filters that produced _df
+        column: Column to count
+        sort_by_count: Sort by descending count if True, otherwise by value
+
+    Returns:
+        pd.DataFrame: DataFrame with the value column and a 'count' column
+    """
+    return count_values(_df[column], sort_by_count)
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def browsing_group_counts(_df: pd.DataFrame, cache_key: Tuple) -> pd.Series:
+    """
+    Count browsing entries over all chart dimensions in a single groupby.
+
+    Args:
+        _df: Filtered browsing DataFrame (not hashed)
+        cache_key: Key identifying the data and filters that produced _df
+
+    Returns:
+        pd.Series: Entry counts indexed by every available grouping column
+    """
+    keys = {column: _df[column] for column in BROWSING_GROUP_COLUMNS if column in _df.columns}
+    if 'status_code' in _df.columns:
+        keys['status_class'] = status_class_categorical(_df['status_code'])
+
+    if not keys:
+        return pd.Series(dtype='int64')
+
+    return pd.DataFrame(keys).groupby(list(keys), observed=True, sort=False, dropna=False).size()
+
+def marginal_counts(group_counts: pd.Series, levels: Union[str, List[str]], sort_by_count: bool = True) -> pd.DataFrame:
+    """
+    Sum grouped counts down to a subset of their index levels.
+
+    Args:
+        group_counts: Counts from browsing_group_counts
+        levels: Index level(s) to keep
+        sort_by_count: Sort by descending count if True, otherwise by value
+
+    Returns:
+        pd.DataFrame: DataFrame with the level column(s) and a 'count' column
+    """
+    counts = group_counts.groupby(level=levels, observed=True, sort=not sort_by_count).sum()
+    if sort_by_count:
+        counts = counts.sort_values(ascending=False)
+    return counts.reset_index(name='count')
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def spam_threshold_counts(_df: pd.DataFrame, cache_key: Tuple) -> pd.DataFrame:
+    """
+    Count emails at or above a range of spam score thresholds.
+
+    Args:
+        _df: Filtered mail DataFrame (not hashed)
+        cache_key: Key identifying the data and filters that produced _df
+
+    Returns:
+        pd.DataFrame: DataFrame with 'threshold' and 'count' columns
+    """
+    thresholds = np.array([0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9])
+
+    # Scores >= t are everything right of t's insertion point in the sorted scores
+    scores = np.sort(_df['spam_score'].dropna().to_numpy())
+    counts = len(scores) - np.searchsorted(scores, thresholds, side='left')
+
+    return pd.DataFrame({'threshold': thresholds, 'count': counts})
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=AGGREGATE_CACHE_ENTRIES, show_spinner=False)
+def histogram_counts(_df: pd.DataFrame, cache_key: Tuple, column: str, bins: int) -> pd.DataFrame:
+    """
+    Bin a numeric column server-side so only the bin counts reach the browser.
+
+    Args:
+        _df: Filtered DataFrame (not hashed)
+        cache_key: Key identifying the data and filters that produced _df
+        column: Numeric column to bin
+        bins: Number of equal-width bins
+
+    Returns:
+        pd.DataFrame: DataFrame with 'bin_start', 'bin_end' and 'count' columns
+    """
+    values = pd.to_numeric(_df[column], errors='coerce').dropna().to_numpy()
+    counts, edges = np.histogram(values, bins=bins)
+
+    return pd.DataFrame({'bin_start': edges[:-1], 'bin_end': edges[1:], 'count': counts})
+
+def tune_hover(fig: go.Figure, n_points: int) -> go.Figure:
+    """
+    Limit hover work on charts built from large datasets.
+
+    Args:
+        fig: Plotly figure to tune
+        n_points: Number of log entries behind the figure
+
+    Returns:
+        go.Figure: The same figure with lighter hover settings
+    """
+    fig.update_layout(
+        hovermode='x' if n_points < HOVER_POINT_LIMIT else False,
+        spikedistance=0,
+        hoverdistance=1
+    )
+    return fig
 
 def show_advanced_charts():
     """Display advanced charts using Plotly."""
@@ -26,8 +390,8 @@ def show_advanced_charts():
         return
 
     # Get the log data
-    df = st.session_state.log_data
     log_type = st.session_state.log_type if 'log_type' in st.session_state else DEFAULT_LOG_TYPE
+    df = _session_prepared_data(log_type)
 
     # Sidebar for controls
     with st.sidebar:
@@ -52,59 +416,55 @@ def show_advanced_charts():
         start_datetime = pd.to_datetime(start_date)
         end_datetime = pd.to_datetime(end_date) + timedelta(days=1) - timedelta(seconds=1)  # End of the day
 
-        # Filter data by date range
-        if 'datetime' in df.columns:
-            filtered_df = df[(df['datetime'] >= start_datetime) & (df['datetime'] <= end_datetime)]
-        else:
-            filtered_df = df  # No datetime column, use all data
-
         # Additional filters based on log type
         st.write("### Filters")
 
+        selections = []
+        spam_range = None
+
         if log_type == "browsing":
             # Filter by username
-            if 'username' in filtered_df.columns:
-                usernames = filtered_df['username'].unique()
+            if 'username' in df.columns:
+                usernames = filter_options(df, 'username')
                 selected_usernames = st.multiselect("Select Users", usernames, default=usernames[:5] if len(usernames) > 5 else usernames)
-                if selected_usernames:
-                    filtered_df = filtered_df[filtered_df['username'].isin(selected_usernames)]
+                selections.append(('username', tuple(selected_usernames)))
 
             # Filter by status code
-            if 'status_code' in filtered_df.columns:
-                status_codes = filtered_df['status_code'].unique()
+            if 'status_code' in df.columns:
+                status_codes = filter_options(df, 'status_code')
                 selected_status = st.multiselect("Select Status Codes", status_codes)
-                if selected_status:
-                    filtered_df = filtered_df[filtered_df['status_code'].isin(selected_status)]
+                selections.append(('status_code', tuple(selected_status)))
 
             # Filter by category
-            if 'category' in filtered_df.columns:
-                categories = filtered_df['category'].unique()
+            if 'category' in df.columns:
+                categories = filter_options(df, 'category')
                 selected_categories = st.multiselect("Select Categories", categories)
-                if selected_categories:
-                    filtered_df = filtered_df[filtered_df['category'].isin(selected_categories)]
+                selections.append(('category', tuple(selected_categories)))
 
         elif log_type == "virus":
             # Filter by severity
-            if 'severity' in filtered_df.columns:
-                severities = filtered_df['severity'].unique()
+            if 'severity' in df.columns:
+                severities = filter_options(df, 'severity')
                 selected_severities = st.multiselect("Select Severities", severities)
-                if selected_severities:
-                    filtered_df = filtered_df[filtered_df['severity'].isin(selected_severities)]
+                selections.append(('severity', tuple(selected_severities)))
 
             # Filter by action taken
-            if 'action_taken' in filtered_df.columns:
-                actions = filtered_df['action_taken'].unique()
+            if 'action_taken' in df.columns:
+                actions = filter_options(df, 'action_taken')
                 selected_actions = st.multiselect("Select Actions", actions)
-                if selected_actions:
-                    filtered_df = filtered_df[filtered_df['action_taken'].isin(selected_actions)]
+                selections.append(('action_taken', tuple(selected_actions)))
 
         elif log_type == "mail":
             # Filter by spam score
-            if 'spam_score' in filtered_df.columns:
-                min_spam = float(filtered_df['spam_score'].min())
-                max_spam = float(filtered_df['spam_score'].max())
+            if 'spam_score' in df.columns:
+                min_spam = float(df['spam_score'].min())
+                max_spam = float(df['spam_score'].max())
                 spam_range = st.slider("Spam Score Range", min_spam, max_spam, (min_spam, max_spam))
-                filtered_df = filtered_df[(filtered_df['spam_score'] >= spam_range[0]) & (filtered_df['spam_score'] <= spam_range[1])]
+
+    # Filter data (cached on the data identity and filter values)
+    selections = tuple(selections)
+    filtered_df = filter_log_data(df, start_datetime, end_datetime, selections, spam_range)
+    cache_key = (frame_identity(df), start_datetime, end_datetime, selections, spam_range)
 
     # Display data summary
     st.subheader("Data Summary")
@@ -116,440 +476,523 @@ def show_advanced_charts():
 
     # Create advanced visualizations based on log type
     if log_type == "browsing":
-        display_browsing_visualizations(filtered_df)
+        display_browsing_visualizations(filtered_df, cache_key)
     elif log_type == "virus":
-        display_virus_visualizations(filtered_df)
+        display_virus_visualizations(filtered_df, cache_key)
     elif log_type == "mail":
-        display_mail_visualizations(filtered_df)
+        display_mail_visualizations(filtered_df, cache_key)
     else:
         st.error(f"Unsupported log type: {log_type}")
 
-def display_browsing_visualizations(df: pd.DataFrame):
+def browsing_traffic_tab(df: pd.DataFrame, group_counts: pd.Series):
     """
-    Display advanced visualizations for browsing logs.
+    Render the traffic tab for browsing logs.
 
     Args:
         df: DataFrame containing browsing log data
+        group_counts: Counts from browsing_group_counts
     """
-    st.subheader("Browsing Log Analysis")
+    st.write("### Traffic Over Time")
+
+    # Check if datetime column exists
+    if 'datetime' in df.columns:
+        # Group by hour
+        hourly_traffic = marginal_counts(group_counts, 'hour', sort_by_count=False)
+
+        # Create hourly traffic chart
+        fig = px.line(hourly_traffic, x='hour', y='count',
+                      title='Hourly Traffic Distribution',
+                      render_mode='webgl',
+                      labels={'hour': 'Hour of Day', 'count': 'Number of Requests'},
+                      markers=True)
+
+        fig.update_layout(
+            xaxis=dict(tickmode='linear', tick0=0, dtick=1),
+            height=500
+        )
+
+        fig = tune_hover(fig, len(df))
+        st.plotly_chart(fig, use_container_width=True)
+
+        # Traffic by day of week
+        if len(df) > 10:  # Only show if we have enough data
+            daily_traffic = marginal_counts(group_counts, 'day_of_week', sort_by_count=False)
+
+            fig = px.bar(daily_traffic, x='day_of_week', y='count',
+                         title='Traffic by Day of Week',
+                         labels={'day_of_week': 'Day', 'count': 'Number of Requests'},
+                         color='count', color_continuous_scale='Viridis')
 
-    # Create tabs for different visualizations
-    tab1, tab2, tab3, tab4 = st.tabs(["Traffic Analysis", "User Activity", "Status Codes", "Categories"])
+            st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.warning("Datetime information not available for time-based analysis.")
 
-    with tab1:
-        st.write("### Traffic Over Time")
+def browsing_users_tab(df: pd.DataFrame, group_counts: pd.Series):
+    """
+    Render the user activity tab for browsing logs.
 
-        # Check if datetime column exists
-        if 'datetime' in df.columns:
-            # Group by hour
-            df['hour'] = df['datetime'].dt.hour
-            hourly_traffic = df.groupby('hour').size().reset_index(name='count')
-
-            # Create hourly traffic chart
-            fig = px.line(hourly_traffic, x='hour', y='count',
-                          title='Hourly Traffic Distribution',
-                          labels={'hour': 'Hour of Day', 'count': 'Number of Requests'},
-                          markers=True)
+    Args:
+        df: DataFrame containing browsing log data
+        group_counts: Counts from browsing_group_counts
+    """
+    st.write("### User Activity Analysis")
 
-            fig.update_layout(
-                xaxis=dict(tickmode='linear', tick0=0, dtick=1),
-                height=500
-            )
+    if 'username' in df.columns and 'ip_address' in df.columns:
+        # User activity by count
+        user_activity = marginal_counts(group_counts, 'username')
 
-            st.plotly_chart(fig, use_container_width=True)
+        fig = px.bar(user_activity.head(10), x='username', y='count',
+                     title='Top 10 Users by Activity',
+                     labels={'username': 'Username', 'count': 'Number of Requests'},
+                     color='count', color_continuous_scale='Viridis')
 
-            # Traffic by day of week
-            if len(df) > 10:  # Only show if we have enough data
-                df['day_of_week'] = df['datetime'].dt.day_name()
-                day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-                daily_traffic = df.groupby('day_of_week').size().reset_index(name='count')
+        st.plotly_chart(fig, use_container_width=True)
 
-                # Reorder days
-                daily_traffic['day_of_week'] = pd.Categorical(daily_traffic['day_of_week'], categories=day_order, ordered=True)
-                daily_traffic = daily_traffic.sort_values('day_of_week')
+        # User activity heatmap
+        if 'datetime' in df.columns:
+            # Get top 5 users
+            top_users = user_activity.head(5)['username'].tolist()
+
+            # Counts by user, day, and hour, accumulated into one matrix per top user
+            user_time_counts = marginal_counts(group_counts, ['username', 'day_of_week', 'hour'], sort_by_count=False)
+            heatmaps = user_activity_heatmaps(user_time_counts, top_users)
+
+            # One faceted figure with a heatmap per user
+            if top_users:
+                fig = px.imshow(heatmaps,
+                                facet_col=0,
+                                facet_col_wrap=HEATMAP_FACET_COLUMNS,
+                                labels=dict(x="Hour of Day", y="Day of Week", color="Request Count"),
+                                x=list(range(24)),
+                                y=DAY_ORDER,
+                                title="Activity Heatmaps for Top Users",
+                                color_continuous_scale="Viridis")
 
-                fig = px.bar(daily_traffic, x='day_of_week', y='count',
-                             title='Traffic by Day of Week',
-                             labels={'day_of_week': 'Day', 'count': 'Number of Requests'},
-                             color='count', color_continuous_scale='Viridis')
+                # Facet titles default to "facet_col=<index>"; show the username instead
+                fig.for_each_annotation(lambda a: a.update(text=top_users[int(a.text.split('=')[1])]))
 
+                facet_rows = -(-len(top_users) // HEATMAP_FACET_COLUMNS)
+                fig.update_layout(height=300 * facet_rows + 100)
                 st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.warning("Datetime information not available for time-based analysis.")
-
-    with tab2:
-        st.write("### User Activity Analysis")
+    else:
+        st.warning("Username or IP address information not available for user analysis.")
 
-        if 'username' in df.columns and 'ip_address' in df.columns:
-            # User activity by count
-            user_activity = df.groupby('username').size().reset_index(name='count')
-            user_activity = user_activity.sort_values('count', ascending=False)
+def browsing_status_tab(df: pd.DataFrame, group_counts: pd.Series):
+    """
+    Render the HTTP status code tab for browsing logs.
 
-            fig = px.bar(user_activity.head(10), x='username', y='count',
-                         title='Top 10 Users by Activity',
-                         labels={'username': 'Username', 'count': 'Number of Requests'},
-                         color='count', color_continuous_scale='Viridis')
+    Args:
+        df: DataFrame containing browsing log data
+        group_counts: Counts from browsing_group_counts
+    """
+    st.write("### HTTP Status Code Analysis")
 
-            st.plotly_chart(fig, use_container_width=True)
+    if 'status_code' in df.columns:
+        # Group status codes by class (2xx, 3xx, 4xx, 5xx)
+        status_class_counts = marginal_counts(group_counts, 'status_class', sort_by_count=False)
 
-            # User activity heatmap
-            if 'datetime' in df.columns:
-                df['hour'] = df['datetime'].dt.hour
-                df['day_of_week'] = df['datetime'].dt.day_name()
-
-                # Get top 5 users
-                top_users = user_activity.head(5)['username'].tolist()
-
-                # Filter for top users
-                top_user_df = df[df['username'].isin(top_users)]
-
-                # Create pivot table for heatmap
-                day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-                top_user_df['day_of_week'] = pd.Categorical(top_user_df['day_of_week'], categories=day_order, ordered=True)
-
-                # Group by user, day, and hour
-                user_time_pivot = top_user_df.groupby(['username', 'day_of_week', 'hour']).size().reset_index(name='count')
-
-                # Create heatmap for each user
-                for user in top_users:
-                    user_data = user_time_pivot[user_time_pivot['username'] == user]
-
-                    # Create pivot table
-                    pivot_data = user_data.pivot(index='day_of_week', columns='hour', values='count').fillna(0)
-
-                    # Reorder days
-                    pivot_data = pivot_data.reindex(day_order)
-
-                    # Create heatmap
-                    try:
-                        # Make sure pivot_data has all hours as columns
-                        for hour in range(24):
-                            if hour not in pivot_data.columns:
-                                pivot_data[hour] = 0
-
-                        # Sort columns to ensure they match the x values
-                        pivot_data = pivot_data.reindex(sorted(pivot_data.columns), axis=1)
-
-                        fig = px.imshow(pivot_data,
-                                        labels=dict(x="Hour of Day", y="Day of Week", color="Request Count"),
-                                        x=list(range(24)),
-                                        y=day_order,
-                                        title=f"Activity Heatmap for {user}",
-                                        color_continuous_scale="Viridis")
-                    except Exception as e:
-                        st.error(f"Error creating heatmap: {e}")
-                        # Create a simple bar chart instead
-                        user_data_sum = user_data.groupby('hour')['count'].sum().reset_index()
-                        fig = px.bar(user_data_sum, x='hour', y='count',
-                                    title=f"Hourly Activity for {user}",
-                                    labels={'hour': 'Hour of Day', 'count': 'Request Count'})
-
-                    fig.update_layout(height=400)
-                    st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.warning("Username or IP address information not available for user analysis.")
+        # Create pie chart for status classes
+        fig = px.pie(status_class_counts, names='status_class', values='count',
+                     title='HTTP Status Code Classes',
+                     color='status_class',
+                     color_discrete_map={'2xx': 'green', '3xx': 'blue', '4xx': 'orange', '5xx': 'red'})
 
-    with tab3:
-        st.write("### HTTP Status Code Analysis")
+        fig.update_traces(textposition='inside', textinfo='percent+label')
+        st.plotly_chart(fig, use_container_width=True)
 
-        if 'status_code' in df.columns:
-            # Group status codes by class (2xx, 3xx, 4xx, 5xx)
-            df['status_class'] = df['status_code'].apply(lambda x: f"{x // 100}xx")
-            status_class_counts = df.groupby('status_class').size().reset_index(name='count')
+        # Create bar chart for specific status codes
+        status_counts = marginal_counts(group_counts, 'status_code')
 
-            # Create pie chart for status classes
-            fig = px.pie(status_class_counts, names='status_class', values='count',
-                         title='HTTP Status Code Classes',
-                         color='status_class',
-                         color_discrete_map={'2xx': 'green', '3xx': 'blue', '4xx': 'orange', '5xx': 'red'})
+        fig = px.bar(status_counts, x='status_code', y='count',
+                     title='HTTP Status Code Distribution',
+                     labels={'status_code': 'Status Code', 'count': 'Number of Requests'},
+                     color='status_code')
 
-            fig.update_traces(textposition='inside', textinfo='percent+label')
-            st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True)
 
-            # Create bar chart for specific status codes
-            status_counts = df.groupby('status_code').size().reset_index(name='count')
-            status_counts = status_counts.sort_values('count', ascending=False)
+        # Status codes over time
+        if 'datetime' in df.columns:
+            # Wide date x status class table, the grouped-count equivalent of a crosstab
+            status_time = (group_counts.groupby(level=['date', 'status_class'], observed=True).sum()
+                           .unstack('status_class', fill_value=0))
 
-            fig = px.bar(status_counts, x='status_code', y='count',
-                         title='HTTP Status Code Distribution',
-                         labels={'status_code': 'Status Code', 'count': 'Number of Requests'},
-                         color='status_code')
+            fig = px.line(status_time,
+                          title='Status Codes Over Time',
+                          render_mode='webgl',
+                          labels={'date': 'Date', 'value': 'Number of Requests', 'status_class': 'Status Class'})
 
+            fig = downsample_figure(fig)
+            fig = tune_hover(fig, len(df))
             st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.warning("Status code information not available for status analysis.")
 
-            # Status codes over time
-            if 'datetime' in df.columns:
-                df['date'] = df['datetime'].dt.date
-                status_time = df.groupby(['date', 'status_class']).size().reset_index(name='count')
+def browsing_categories_tab(df: pd.DataFrame, group_counts: pd.Series):
+    """
+    Render the category tab for browsing logs.
 
-                fig = px.line(status_time, x='date', y='count', color='status_class',
-                              title='Status Codes Over Time',
-                              labels={'date': 'Date', 'count': 'Number of Requests', 'status_class': 'Status Class'})
+    Args:
+        df: DataFrame containing browsing log data
+        group_counts: Counts from browsing_group_counts
+    """
+    st.write("### Category Analysis")
+
+    if 'category' in df.columns:
+        # Category distribution
+        category_counts = marginal_counts(group_counts, 'category')
+
+        fig = px.bar(category_counts.head(10), x='category', y='count',
+                     title='Top 10 Categories',
+                     labels={'category': 'Category', 'count': 'Number of Requests'},
+                     color='count', color_continuous_scale='Viridis')
+
+        st.plotly_chart(fig, use_container_width=True)
+
+        # Category by user
+        if 'username' in df.columns:
+            # Get top 5 users and top 5 categories
+            top_users = marginal_counts(group_counts, 'username').head(5)['username'].tolist()
+            top_categories = category_counts.head(5)['category'].tolist()
+
+            # Scatter user/category counts straight into a top users x top categories matrix
+            user_category = marginal_counts(group_counts, ['username', 'category'], sort_by_count=False)
+            user_codes = pd.Categorical(user_category['username'], categories=top_users).codes
+            category_codes = pd.Categorical(user_category['category'], categories=top_categories).codes
+            valid = (user_codes >= 0) & (category_codes >= 0)
+
+            user_category_matrix = np.zeros((len(top_users), len(top_categories)), dtype=np.int64)
+            np.add.at(user_category_matrix, (user_codes[valid], category_codes[valid]),
+                      user_category['count'].to_numpy()[valid])
+
+            fig = px.imshow(user_category_matrix,
+                            x=top_categories,
+                            y=top_users,
+                            labels=dict(x="Category", y="Username", color="Request Count"),
+                            title="User-Category Heatmap",
+                            color_continuous_scale="Viridis")
+
+            fig.update_layout(height=400)
+            st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.warning("Category information not available for category analysis.")
 
-                st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.warning("Status code information not available for status analysis.")
+def display_browsing_visualizations(df: pd.DataFrame, cache_key: Tuple):
+    """
+    Display advanced visualizations for browsing logs.
+
+    Args:
+        df: DataFrame containing browsing log data
+        cache_key: Key identifying the data and filters, used for cached aggregates
+    """
+    st.subheader("Browsing Log Analysis")
 
-    with tab4:
-        st.write("### Category Analysis")
+    # Pick one section to show; unlike st.tabs, only the selected section is computed and drawn
+    view = _section_selector(["Traffic Analysis", "User Activity", "Status Codes", "Categories"],
+                             "advanced_browsing_view")
 
-        if 'category' in df.columns:
-            # Category distribution
-            category_counts = df.groupby('category').size().reset_index(name='count')
-            category_counts = category_counts.sort_values('count', ascending=False)
+    # Count once over every dimension; each chart sums down to the levels it needs
+    group_counts = browsing_group_counts(df, cache_key)
 
-            fig = px.bar(category_counts.head(10), x='category', y='count',
-                         title='Top 10 Categories',
-                         labels={'category': 'Category', 'count': 'Number of Requests'},
-                         color='count', color_continuous_scale='Viridis')
+    if view == "Traffic Analysis":
+        browsing_traffic_tab(df, group_counts)
+    elif view == "User Activity":
+        browsing_users_tab(df, group_counts)
+    elif view == "Status Codes":
+        browsing_status_tab(df, group_counts)
+    elif view == "Categories":
+        browsing_categories_tab(df, group_counts)
 
-            st.plotly_chart(fig, use_container_width=True)
+def virus_distribution_tab(df: pd.DataFrame, cache_key: Tuple):
+    """
+    Render the virus distribution tab for virus logs.
 
-            # Category by user
-            if 'username' in df.columns:
-                # Get top 5 users and top 5 categories
-                top_users = df.groupby('username').size().reset_index(name='count').sort_values('count', ascending=False).head(5)['username'].tolist()
-                top_categories = category_counts.head(5)['category'].tolist()
+    Args:
+        df: DataFrame containing virus log data
+        cache_key: Key identifying the data and filters, used for cached aggregates
+    """
+    st.write("### Virus Type Distribution")
 
-                # Filter data
-                top_data = df[df['username'].isin(top_users) & df['category'].isin(top_categories)]
+    if 'virus_name' in df.columns:
+        # Virus name distribution
+        virus_counts = cached_count_values(df, cache_key, 'virus_name')
 
-                # Group by user and category
-                user_category = top_data.groupby(['username', 'category']).size().reset_index(name='count')
+        fig = px.bar(virus_counts.head(10), x='virus_name', y='count',
+                     title='Top 10 Virus Types',
+                     labels={'virus_name': 'Virus Name', 'count': 'Occurrences'},
+                     color='count', color_continuous_scale='Reds')
 
-                # Create heatmap
-                user_category_pivot = user_category.pivot(index='username', columns='category', values='count').fillna(0)
+        st.plotly_chart(fig, use_container_width=True)
 
-                fig = px.imshow(user_category_pivot,
-                                labels=dict(x="Category", y="Username", color="Request Count"),
-                                title="User-Category Heatmap",
-                                color_continuous_scale="Viridis")
+        # Pie chart for virus distribution
+        fig = px.pie(virus_counts.head(5), names='virus_name', values='count',
+                     title='Top 5 Virus Types Distribution')
 
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.warning("Category information not available for category analysis.")
+        fig.update_traces(textposition='inside', textinfo='percent+label')
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.warning("Virus name information not available for virus distribution analysis.")
 
-def display_virus_visualizations(df: pd.DataFrame):
+def virus_severity_tab(df: pd.DataFrame, cache_key: Tuple):
     """
-    Display advanced visualizations for virus logs.
+    Render the severity tab for virus logs.
 
     Args:
         df: DataFrame containing virus log data
+        cache_key: Key identifying the data and filters, used for cached aggregates
     """
-    st.subheader("Virus Log Analysis")
+    st.write("### Severity Analysis")
 
-    # Create tabs for different visualizations
-    tab1, tab2, tab3 = st.tabs(["Virus Distribution", "Severity Analysis", "Time Trends"])
+    if 'severity' in df.columns:
+        # Severity distribution
+        severity_counts = cached_count_values(df, cache_key, 'severity', sort_by_count=False)
 
-    with tab1:
-        st.write("### Virus Type Distribution")
+        # Create a custom color map for severity
+        severity_colors = {'high': 'red', 'medium': 'orange', 'low': 'yellow', 'info': 'blue'}
 
-        if 'virus_name' in df.columns:
-            # Virus name distribution
-            virus_counts = df.groupby('virus_name').size().reset_index(name='count')
-            virus_counts = virus_counts.sort_values('count', ascending=False)
+        fig = px.bar(severity_counts, x='severity', y='count',
+                     title='Severity Distribution',
+                     labels={'severity': 'Severity Level', 'count': 'Occurrences'},
+                     color='severity',
+                     color_discrete_map=severity_colors)
 
-            fig = px.bar(virus_counts.head(10), x='virus_name', y='count',
-                         title='Top 10 Virus Types',
-                         labels={'virus_name': 'Virus Name', 'count': 'Occurrences'},
-                         color='count', color_continuous_scale='Reds')
+        st.plotly_chart(fig, use_container_width=True)
 
-            st.plotly_chart(fig, use_container_width=True)
+        # Severity by action taken
+        if 'action_taken' in df.columns:
+            severity_action = df.groupby(['severity', 'action_taken'], observed=True, sort=False).size().reset_index(name='count')
 
-            # Pie chart for virus distribution
-            fig = px.pie(virus_counts.head(5), names='virus_name', values='count',
-                         title='Top 5 Virus Types Distribution')
+            fig = px.bar(severity_action, x='severity', y='count', color='action_taken',
+                         title='Actions Taken by Severity Level',
+                         labels={'severity': 'Severity Level', 'count': 'Occurrences', 'action_taken': 'Action Taken'},
+                         barmode='group')
 
-            fig.update_traces(textposition='inside', textinfo='percent+label')
             st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.warning("Virus name information not available for virus distribution analysis.")
-
-    with tab2:
-        st.write("### Severity Analysis")
-
-        if 'severity' in df.columns:
-            # Severity distribution
-            severity_counts = df.groupby('severity').size().reset_index(name='count')
+    else:
+        st.warning("Severity information not available for severity analysis.")
 
-            # Create a custom color map for severity
-            severity_colors = {'high': 'red', 'medium': 'orange', 'low': 'yellow', 'info': 'blue'}
+def virus_trends_tab(df: pd.DataFrame, cache_key: Tuple):
+    """
+    Render the time trend tab for virus logs.
 
-            fig = px.bar(severity_counts, x='severity', y='count',
-                         title='Severity Distribution',
-                         labels={'severity': 'Severity Level', 'count': 'Occurrences'},
-                         color='severity',
-                         color_discrete_map=severity_colors)
+    Args:
+        df: DataFrame containing virus log data
+        cache_key: Key identifying the data and filters, used for cached aggregates
+    """
+    st.write("### Time Trends")
 
-            st.plotly_chart(fig, use_container_width=True)
+    if 'datetime' in df.columns:
+        # Group by date
+        date_counts = cached_count_values(df, cache_key, 'date', sort_by_count=False)
 
-            # Severity by action taken
-            if 'action_taken' in df.columns:
-                severity_action = df.groupby(['severity', 'action_taken']).size().reset_index(name='count')
+        fig = px.line(date_counts, x='date', y='count',
+                      title='Virus Detections Over Time',
+                      render_mode='webgl',
+                      labels={'date': 'Date', 'count': 'Number of Detections'},
+                      markers=True)
 
-                fig = px.bar(severity_action, x='severity', y='count', color='action_taken',
-                             title='Actions Taken by Severity Level',
-                             labels={'severity': 'Severity Level', 'count': 'Occurrences', 'action_taken': 'Action Taken'},
-                             barmode='group')
+        fig = downsample_figure(fig)
+        fig = tune_hover(fig, len(df))
+        st.plotly_chart(fig, use_container_width=True)
 
-                st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.warning("Severity information not available for severity analysis.")
-
-    with tab3:
-        st.write("### Time Trends")
+        # Severity over time
+        if 'severity' in df.columns:
+            severity_time = df.groupby(['date', 'severity'], observed=True).size().reset_index(name='count')
 
-        if 'datetime' in df.columns:
-            # Group by date
-            df['date'] = df['datetime'].dt.date
-            date_counts = df.groupby('date').size().reset_index(name='count')
-
-            fig = px.line(date_counts, x='date', y='count',
-                          title='Virus Detections Over Time',
-                          labels={'date': 'Date', 'count': 'Number of Detections'},
-                          markers=True)
+            fig = px.line(severity_time, x='date', y='count', color='severity',
+                          title='Severity Levels Over Time',
+                          render_mode='webgl',
+                          labels={'date': 'Date', 'count': 'Number of Detections', 'severity': 'Severity Level'})
 
+            fig = downsample_figure(fig)
+            fig = tune_hover(fig, len(df))
             st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.warning("Datetime information not available for time trend analysis.")
 
-            # Severity over time
-            if 'severity' in df.columns:
-                severity_time = df.groupby(['date', 'severity']).size().reset_index(name='count')
+def display_virus_visualizations(df: pd.DataFrame, cache_key: Tuple):
+    """
+    Display advanced visualizations for virus logs.
 
-                fig = px.line(severity_time, x='date', y='count', color='severity',
-                              title='Severity Levels Over Time',
-                              labels={'date': 'Date', 'count': 'Number of Detections', 'severity': 'Severity Level'})
+    Args:
+        df: DataFrame containing virus log data
+        cache_key: Key identifying the data and filters, used for cached aggregates
+    """
+    st.subheader("Virus Log Analysis")
 
-                st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.warning("Datetime information not available for time trend analysis.")
+    # Pick one section to show; unlike st.tabs, only the selected section is computed and drawn
+    view = _section_selector(["Virus Distribution", "Severity Analysis", "Time Trends"], "advanced_virus_view")
+
+    if view == "Virus Distribution":
+        virus_distribution_tab(df, cache_key)
+    elif view == "Severity Analysis":
+        virus_severity_tab(df, cache_key)
+    elif view == "Time Trends":
+        virus_trends_tab(df, cache_key)
 
-def display_mail_visualizations(df: pd.DataFrame):
+def mail_traffic_tab(df: pd.DataFrame, cache_key: Tuple):
     """
-    Display advanced visualizations for mail logs.
+    Render the mail traffic tab for mail logs.
 
     Args:
         df: DataFrame containing mail log data
+        cache_key: Key identifying the data and filters, used for cached aggregates
     """
-    st.subheader("Mail Log Analysis")
+    st.write("### Mail Traffic Analysis")
 
-    # Create tabs for different visualizations
-    tab1, tab2, tab3 = st.tabs(["Mail Traffic", "Spam Analysis", "Attachment Analysis"])
+    if 'datetime' in df.columns:
+        # Group by date
+        date_counts = cached_count_values(df, cache_key, 'date', sort_by_count=False)
 
-    with tab1:
-        st.write("### Mail Traffic Analysis")
+        fig = px.line(date_counts, x='date', y='count',
+                      title='Mail Traffic Over Time',
+                      render_mode='webgl',
+                      labels={'date': 'Date', 'count': 'Number of Emails'},
+                      markers=True)
 
-        if 'datetime' in df.columns:
-            # Group by date
-            df['date'] = df['datetime'].dt.date
-            date_counts = df.groupby('date').size().reset_index(name='count')
+        fig = downsample_figure(fig)
+        fig = tune_hover(fig, len(df))
+        st.plotly_chart(fig, use_container_width=True)
 
-            fig = px.line(date_counts, x='date', y='count',
-                          title='Mail Traffic Over Time',
-                          labels={'date': 'Date', 'count': 'Number of Emails'},
-                          markers=True)
+        # Mail traffic by hour
+        hourly_traffic = cached_count_values(df, cache_key, 'hour', sort_by_count=False)
 
-            st.plotly_chart(fig, use_container_width=True)
+        fig = px.bar(hourly_traffic, x='hour', y='count',
+                     title='Hourly Mail Distribution',
+                     labels={'hour': 'Hour of Day', 'count': 'Number of Emails'},
+                     color='count', color_continuous_scale='Blues')
 
-            # Mail traffic by hour
-            df['hour'] = df['datetime'].dt.hour
-            hourly_traffic = df.groupby('hour').size().reset_index(name='count')
+        fig.update_layout(xaxis=dict(tickmode='linear', tick0=0, dtick=1))
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.warning("Datetime information not available for mail traffic analysis.")
 
-            fig = px.bar(hourly_traffic, x='hour', y='count',
-                         title='Hourly Mail Distribution',
-                         labels={'hour': 'Hour of Day', 'count': 'Number of Emails'},
-                         color='count', color_continuous_scale='Blues')
+def mail_spam_tab(df: pd.DataFrame, cache_key: Tuple):
+    """
+    Render the spam tab for mail logs.
+
+    Args:
+        df: DataFrame containing mail log data
+        cache_key: Key identifying the data and filters, used for cached aggregates
+    """
+    st.write("### Spam Analysis")
+
+    if 'spam_score' in df.columns:
+        # Bin spam scores server-side instead of shipping every score to the browser
+        spam_hist = histogram_counts(df, cache_key, 'spam_score', SPAM_HISTOGRAM_BINS)
+
+        fig = go.Figure(go.Bar(x=(spam_hist['bin_start'] + spam_hist['bin_end']) / 2, y=spam_hist['count'],
+                               width=spam_hist['bin_end'] - spam_hist['bin_start'], marker_color='blue'))
+
+        fig.update_layout(title='Distribution of Spam Scores',
+                          xaxis_title='Spam Score',
+                          yaxis_title='Number of Emails',
+                          bargap=0.1)
+        fig = tune_hover(fig, len(df))
+        st.plotly_chart(fig, use_container_width=True)
+
+        # Spam score threshold analysis
+        spam_threshold_df = spam_threshold_counts(df, cache_key)
+
+        fig = px.line(spam_threshold_df, x='threshold', y='count',
+                      title='Emails Above Spam Score Threshold',
+                      render_mode='webgl',
+                      labels={'threshold': 'Spam Score Threshold', 'count': 'Number of Emails'},
+                      markers=True)
+
+        st.plotly_chart(fig, use_container_width=True)
+
+        # Spam by sender domain
+        if 'sender' in df.columns:
+            # Extract domain from sender email
+            sender = df['sender']
+            if not isinstance(sender.dtype, pd.StringDtype):
+                sender = sender.astype('string')
+            df['sender_domain'] = sender.str.rsplit('@', n=1).str[-1].where(sender.str.contains('@', regex=False).fillna(False), 'Unknown')
+
+            # Group by domain and calculate average spam score
+            domain_spam = df.groupby('sender_domain')['spam_score'].mean().reset_index()
+            domain_spam = domain_spam.sort_values('spam_score', ascending=False)
+
+            fig = px.bar(domain_spam.head(10), x='sender_domain', y='spam_score',
+                         title='Top 10 Domains by Average Spam Score',
+                         labels={'sender_domain': 'Sender Domain', 'spam_score': 'Average Spam Score'},
+                         color='spam_score', color_continuous_scale='Reds')
 
-            fig.update_layout(xaxis=dict(tickmode='linear', tick0=0, dtick=1))
             st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.warning("Datetime information not available for mail traffic analysis.")
+    else:
+        st.warning("Spam score information not available for spam analysis.")
 
-    with tab2:
-        st.write("### Spam Analysis")
+def mail_attachments_tab(df: pd.DataFrame, cache_key: Tuple):
+    """
+    Render the attachment tab for mail logs.
 
-        if 'spam_score' in df.columns:
-            # Create histogram of spam scores
-            fig = px.histogram(df, x='spam_score',
-                               title='Distribution of Spam Scores',
-                               labels={'spam_score': 'Spam Score', 'count': 'Number of Emails'},
-                               color_discrete_sequence=['blue'])
+    Args:
+        df: DataFrame containing mail log data
+        cache_key: Key identifying the data and filters, used for cached aggregates
+    """
+    st.write("### Attachment Analysis")
 
-            fig.update_layout(bargap=0.1)
-            st.plotly_chart(fig, use_container_width=True)
+    if 'attachment_count' in df.columns:
+        # Distribution of attachment counts
+        attachment_dist = cached_count_values(df, cache_key, 'attachment_count', sort_by_count=False)
 
-            # Spam score threshold analysis
-            thresholds = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9]
-            spam_counts = []
+        fig = px.bar(attachment_dist, x='attachment_count', y='count',
+                     title='Distribution of Attachment Counts',
+                     labels={'attachment_count': 'Number of Attachments', 'count': 'Number of Emails'},
+                     color='attachment_count')
 
-            for threshold in thresholds:
-                spam_count = (df['spam_score'] >= threshold).sum()
-                spam_counts.append({'threshold': threshold, 'count': spam_count})
+        st.plotly_chart(fig, use_container_width=True)
 
-            spam_threshold_df = pd.DataFrame(spam_counts)
+        # Relationship between attachments and spam score
+        if 'spam_score' in df.columns:
+            # Calculate average spam score by attachment count
+            attachment_spam = df.groupby('attachment_count')['spam_score'].mean().reset_index()
 
-            fig = px.line(spam_threshold_df, x='threshold', y='count',
-                          title='Emails Above Spam Score Threshold',
-                          labels={'threshold': 'Spam Score Threshold', 'count': 'Number of Emails'},
+            fig = px.line(attachment_spam, x='attachment_count', y='spam_score',
+                          title='Average Spam Score by Attachment Count',
+                          render_mode='webgl',
+                          labels={'attachment_count': 'Number of Attachments', 'spam_score': 'Average Spam Score'},
                           markers=True)
 
             st.plotly_chart(fig, use_container_width=True)
 
-            # Spam by sender domain
-            if 'sender' in df.columns:
-                # Extract domain from sender email
-                df['sender_domain'] = df['sender'].apply(lambda x: x.split('@')[-1] if '@' in str(x) else 'Unknown')
-
-                # Group by domain and calculate average spam score
-                domain_spam = df.groupby('sender_domain')['spam_score'].mean().reset_index()
-                domain_spam = domain_spam.sort_values('spam_score', ascending=False)
-
-                fig = px.bar(domain_spam.head(10), x='sender_domain', y='spam_score',
-                             title='Top 10 Domains by Average Spam Score',
-                             labels={'sender_domain': 'Sender Domain', 'spam_score': 'Average Spam Score'},
-                             color='spam_score', color_continuous_scale='Reds')
-
-                st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.warning("Spam score information not available for spam analysis.")
-
-    with tab3:
-        st.write("### Attachment Analysis")
+            # Spam score range per attachment count (one point per count instead of per email)
+            attachment_stats = df.groupby('attachment_count')['spam_score'].agg(['mean', 'min', 'max', 'count']).reset_index()
 
-        if 'attachment_count' in df.columns:
-            # Distribution of attachment counts
-            attachment_dist = df.groupby('attachment_count').size().reset_index(name='count')
-
-            fig = px.bar(attachment_dist, x='attachment_count', y='count',
-                         title='Distribution of Attachment Counts',
-                         labels={'attachment_count': 'Number of Attachments', 'count': 'Number of Emails'},
-                         color='attachment_count')
+            fig = px.scatter(attachment_stats, x='attachment_count', y='mean',
+                             error_y=attachment_stats['max'] - attachment_stats['mean'],
+                             error_y_minus=attachment_stats['mean'] - attachment_stats['min'],
+                             size='count',
+                             title='Attachment Count vs Spam Score',
+                             render_mode='webgl',
+                             labels={'attachment_count': 'Number of Attachments', 'mean': 'Spam Score', 'count': 'Number of Emails'},
+                             color='mean', color_continuous_scale='Reds',
+                             opacity=0.7)
 
+            fig = tune_hover(fig, len(df))
             st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.warning("Attachment count information not available for attachment analysis.")
 
-            # Relationship between attachments and spam score
-            if 'spam_score' in df.columns:
-                # Calculate average spam score by attachment count
-                attachment_spam = df.groupby('attachment_count')['spam_score'].mean().reset_index()
-
-                fig = px.line(attachment_spam, x='attachment_count', y='spam_score',
-                              title='Average Spam Score by Attachment Count',
-                              labels={'attachment_count': 'Number of Attachments', 'spam_score': 'Average Spam Score'},
-                              markers=True)
+def display_mail_visualizations(df: pd.DataFrame, cache_key: Tuple):
+    """
+    Display advanced visualizations for mail logs.
 
-                st.plotly_chart(fig, use_container_width=True)
+    Args:
+        df: DataFrame containing mail log data
+        cache_key: Key identifying the data and filters, used for cached aggregates
+    """
+    st.subheader("Mail Log Analysis")
 
-                # Scatter plot of attachment count vs spam score
-                fig = px.scatter(df, x='attachment_count', y='spam_score',
-                                 title='Attachment Count vs Spam Score',
-                                 labels={'attachment_count': 'Number of Attachments', 'spam_score': 'Spam Score'},
-                                 color='spam_score', color_continuous_scale='Reds',
-                                 opacity=0.7)
+    # Pick one section to show; unlike st.tabs, only the selected section is computed and drawn
+    view = _section_selector(["Mail Traffic", "Spam Analysis", "Attachment Analysis"], "advanced_mail_view")
 
-                fig.update_traces(marker=dict(size=10))
-                st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.warning("Attachment count information not available for attachment analysis.")
+    if view == "Mail Traffic":
+        mail_traffic_tab(df, cache_key)
+    elif view == "Spam Analysis":
+        mail_spam_tab(df, cache_key)
+    elif view == "Attachment Analysis":
+        mail_attachments_tab(df, cache_key)
 
 # Run the advanced charts if this file is executed directly
 if __name__ == "__main__":
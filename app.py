@@ -23,16 +23,7 @@ from pages import (home_page, charts_page, advanced_charts_page, historical_dash
 
 # Initialize session state variables if not already set
 if 'logged_in' not in st.session_state:
-    st.session_state.logged_in = False
-
-if 'username' not in st.session_state:
-    st.session_state.username = None
-
-if 'user_role' not in st.session_state:
-    st.session_state.user_role = None
-
-if 'login_time' not in st.session_state:
-    st.session_state.login_time = None
+    st.session_state.update(logged_in=False, username=None, user_role=None, login_time=None)
 
 # Initialize application state variables
 if 'log_data' not in st.session_state:
@@ -1,24 +1,47 @@
 import streamlit as st
 import os
+import re
 import json
+import functools
 import hashlib
+import hmac
+import itertools
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+# Try to import orjson, but make it optional
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# fcntl is POSIX-only; without it the users log is appended to unlocked
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 from config import AUTH_TIMEOUT, MIN_PASSWORD_LENGTH
 
-# Initialize session state variables if not already set
+# Initialize session state variables if not already set (they are always set together)
 if 'logged_in' not in st.session_state:
-    st.session_state.logged_in = False
+    st.session_state.update(logged_in=False, username=None, user_role=None, login_time=None)
 
-if 'username' not in st.session_state:
-    st.session_state.username = None
+# Usernames: letters, digits, '.', '_' and '-', starting with a letter or digit
+_USERNAME_RE = re.compile(r'[A-Za-z0-9][A-Za-z0-9_.-]{0,63}')
 
-if 'user_role' not in st.session_state:
-    st.session_state.user_role = None
+# Minimum seconds between session timeout refreshes
+SESSION_REFRESH_INTERVAL = AUTH_TIMEOUT / 10
 
-if 'login_time' not in st.session_state:
-    st.session_state.login_time = None
+# Seconds a check_user_role session check is reused (covers the calls made in one run)
+ROLE_CHECK_TTL = 1.0
 
 # Path to the users directory
 USERS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "users")
@@ -26,12 +49,186 @@ USERS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file_
 # Create users directory if it doesn't exist
 os.makedirs(USERS_DIR, exist_ok=True)
 
+# Append-only log of user records; the last record for an email wins
+USERS_LOG_FILE = os.path.join(USERS_DIR, "users.jsonl")
+USERS_LOCK_FILE = os.path.join(USERS_DIR, "_users.lock")
+
+# Threads used to read per-user JSON files from older versions
+USER_READ_WORKERS = 8
+
+class UserDB(NamedTuple):
+    """In-memory user records."""
+    by_email: Dict[str, Dict]
+    by_username: Dict[str, Dict]
+
+def _loads_json(content: bytes):
+    """Parse JSON bytes."""
+    return orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content)
+
+def _load_json(path: str):
+    """Read and parse a JSON file."""
+    with open(path, 'rb') as f:
+        return _loads_json(f.read())
+
+def _dump_json(data) -> bytes:
+    """Serialize data to JSON bytes."""
+    return orjson.dumps(data) if ORJSON_AVAILABLE else json.dumps(data).encode()
+
+def _iter_user_files() -> Iterator[os.DirEntry]:
+    """Yield the directory entries of per-user JSON files from older versions."""
+    if not os.path.isdir(USERS_DIR):
+        return
+
+    with os.scandir(USERS_DIR) as entries:
+        for entry in entries:
+            if entry.name.endswith('.json') and not entry.name.startswith('_') and entry.is_file():
+                yield entry
+
+def _read_user_files() -> List[Dict]:
+    """
+    Read all per-user JSON files, overlapping the file reads on a thread pool.
+
+    Returns:
+        List[Dict]: User data from each file
+    """
+    paths = [entry.path for entry in _iter_user_files()]
+    if not paths:
+        return []
+
+    with ThreadPoolExecutor(max_workers=USER_READ_WORKERS) as executor:
+        return list(executor.map(_load_json, paths))
+
+def _read_user_log() -> Iterator[Dict]:
+    """Yield the records of the users log in the order they were written."""
+    try:
+        with open(USERS_LOG_FILE, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield _loads_json(line)
+    except FileNotFoundError:
+        return
+
+def _append_user_record(user_data: Dict):
+    """Append a user record to the users log."""
+    with open(USERS_LOG_FILE, 'ab') as f:
+        f.write(_dump_json(user_data) + b'\n')
+
+@contextmanager
+def _users_lock():
+    """Hold an exclusive lock while the users log is checked and appended to."""
+    with open(USERS_LOCK_FILE, 'a') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+@st.cache_resource(show_spinner=False)
+def _load_user_db() -> UserDB:
+    """
+    Load all user records into memory, shared across sessions.
+
+    Returns:
+        UserDB: User records keyed by email and by username
+    """
+    user_db = UserDB({}, {})
+
+    # Per-user files from older versions first, so later log records override them
+    for data in itertools.chain(_read_user_files(), _read_user_log()):
+        if data.get('email'):
+            user_db.by_email[data['email']] = data
+            user_db.by_username[data['username']] = data
+
+    return user_db
+
+def _email_marker_path(email: str) -> str:
+    """Path of the zero-byte marker file recording that an email is registered."""
+    email_hash = hashlib.sha256(email.encode()).hexdigest()[:16]
+    return os.path.join(USERS_DIR, f"_email_{email_hash}.marker")
+
+def _find_user_by_email(email: str) -> Optional[Dict]:
+    """
+    Look up a user's data by email address.
+
+    Args:
+        email: Email address to look up
+
+    Returns:
+        Optional[Dict]: User data, or None if no user has this email
+    """
+    user_data = _load_user_db().by_email.get(email)
+
+    # Unknown emails are rejected by a single stat; a marker means another
+    # server process registered the email after the records were loaded
+    if user_data is None and os.path.exists(_email_marker_path(email)):
+        _load_user_db.clear()
+        user_data = _load_user_db().by_email.get(email)
+
+    return user_data
+
+# Argon2id hasher for stored passwords
+PASSWORD_HASHER = PasswordHasher(time_cost=3, memory_cost=64 * 1024, parallelism=1)
+
+def _hash_password(password: str) -> str:
+    """Hash a password for storage."""
+    return PASSWORD_HASHER.hash(password)
+
+@functools.lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """Hash checked against when an email is unknown."""
+    return _hash_password(os.urandom(16).hex())
+
+def _is_legacy_hash(password_hash: str) -> bool:
+    """Check whether a stored hash is an unsalted SHA-256 hex digest from older accounts."""
+    return len(password_hash) == 64 and all(c in '0123456789abcdef' for c in password_hash)
+
+def _save_user(user_data: Dict):
+    """Record updated user data in the users log."""
+    with _users_lock():
+        _append_user_record(user_data)
+
+def _verify_password(user_data: Dict, password: str) -> bool:
+    """
+    Check a password against a user's stored hash.
+
+    Legacy SHA-256 hashes and outdated Argon2 parameters are rehashed
+    after a successful check.
+
+    Args:
+        user_data: User data containing 'password_hash'
+        password: Password entered by the user
+
+    Returns:
+        bool: True if the password matches
+    """
+    password_hash = user_data.get('password_hash', '')
+
+    if _is_legacy_hash(password_hash):
+        if not hmac.compare_digest(hashlib.sha256(password.encode()).digest(), bytes.fromhex(password_hash)):
+            return False
+    else:
+        try:
+            PASSWORD_HASHER.verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+        if not PASSWORD_HASHER.check_needs_rehash(password_hash):
+            return True
+
+    # Upgrade the stored hash now that we have the plaintext
+    user_data['password_hash'] = _hash_password(password)
+    _save_user(user_data)
+    return True
+
 # Check if user session is still valid
 def check_session_validity():
     """Check if the user's session is still valid based on timeout."""
     if st.session_state.logged_in and st.session_state.login_time:
         # Calculate time elapsed since login
-        elapsed_time = time.time() - st.session_state.login_time
+        now = time.time()
+        elapsed_time = now - st.session_state.login_time
 
         # If session has timed out, log the user out
         if elapsed_time > AUTH_TIMEOUT:
@@ -39,8 +236,9 @@ def check_session_validity():
             st.warning("Your session has expired. Please log in again.")
             return False
 
-        # Refresh the login time to extend the session
-        st.session_state.login_time = time.time()
+        # Refresh the login time to extend the session, at most every SESSION_REFRESH_INTERVAL
+        if elapsed_time > SESSION_REFRESH_INTERVAL:
+            st.session_state.login_time = now
         return True
 
     return False
@@ -80,7 +278,7 @@ def login_page():
             return
 
         # First check for demo account
-        if email == "demo@example.com" and password == "password":
+        if hmac.compare_digest(email.encode(), b"demo@example.com") and hmac.compare_digest(password.encode(), b"password"):
             # Set session state variables for demo user
             st.session_state.logged_in = True
             st.session_state.username = "demo@example.com"
@@ -93,34 +291,17 @@ def login_page():
 
         # Try to authenticate with local user accounts
         try:
-            # Check if users directory exists
-            if not os.path.exists(USERS_DIR):
-                st.error("Login Failed: Invalid credentials.")
-                st.info("Use demo@example.com / password for demo access or create a new account.")
-                return
-
             # Find user file by email
-            user_found = False
-            user_data = None
-
-            for filename in os.listdir(USERS_DIR):
-                if filename.endswith('.json'):
-                    file_path = os.path.join(USERS_DIR, filename)
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
-                        if data.get('email') == email:
-                            user_found = True
-                            user_data = data
-                            break
-
-            if not user_found or not user_data:
-                st.error("Login Failed: User not found.")
+            user_data = _find_user_by_email(email)
+
+            # Verify password (unknown emails still pay for a hash so timing doesn't reveal them)
+            if not user_data:
+                _verify_password({'password_hash': _dummy_password_hash()}, password)
+                st.error("Login Failed: Invalid credentials.")
                 return
 
-            # Verify password
-            hashed_password = hashlib.sha256(password.encode()).hexdigest()
-            if user_data.get('password_hash') != hashed_password:
-                st.error("Login Failed: Incorrect password.")
+            if not _verify_password(user_data, password):
+                st.error("Login Failed: Invalid credentials.")
                 return
 
             # Set session state variables
@@ -154,6 +335,10 @@ def signup_page():
             st.error("Please fill in all fields.")
             return
 
+        if not _USERNAME_RE.fullmatch(username):
+            st.error("Invalid username. Use up to 64 letters, numbers, '.', '_' or '-', starting with a letter or number.")
+            return
+
         if password != confirm_password:
             st.error("Passwords do not match.")
             return
@@ -164,39 +349,37 @@ def signup_page():
 
         # Create a local user account
         try:
-            # Create a user file with hashed password
-            user_file = os.path.join(USERS_DIR, f"{username}.json")
-
-            # Check if user already exists
-            if os.path.exists(user_file):
-                st.error(f"User {username} already exists. Please choose a different username.")
-                return
-
-            # Check if email is already in use
-            for filename in os.listdir(USERS_DIR):
-                if filename.endswith('.json'):
-                    file_path = os.path.join(USERS_DIR, filename)
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
-                        if data.get('email') == email:
-                            st.error(f"Email {email} is already in use. Please use a different email.")
-                            return
-
-            # Hash the password
-            hashed_password = hashlib.sha256(password.encode()).hexdigest()
-
-            # Create user data
-            user_data = {
-                "username": username,
-                "email": email,
-                "password_hash": hashed_password,
-                "role": "analyst",
-                "created_at": datetime.now().isoformat()
-            }
-
-            # Save user data to file
-            with open(user_file, 'w') as f:
-                json.dump(user_data, f)
+            with _users_lock():
+                # Reload so accounts created by other server processes are seen
+                _load_user_db.clear()
+                user_db = _load_user_db()
+
+                # Check if user already exists
+                if username in user_db.by_username:
+                    st.error(f"User {username} already exists. Please choose a different username.")
+                    return
+
+                # Check if email is already in use
+                if email in user_db.by_email:
+                    st.error(f"Email {email} is already in use. Please use a different email.")
+                    return
+
+                # Hash the password
+                hashed_password = _hash_password(password)
+
+                # Create user data
+                user_data = {
+                    "username": username,
+                    "email": email,
+                    "password_hash": hashed_password,
+                    "role": "analyst",
+                    "created_at": datetime.now().isoformat()
+                }
+
+                # Save user data to the users log
+                _append_user_record(user_data)
+                open(_email_marker_path(email), 'wb').close()
+                _load_user_db.clear()
 
             st.success('Account created successfully! Please log in using your email and password.')
             return
@@ -212,10 +395,12 @@ def logout_user():
         st.session_state.username = None
         st.session_state.user_role = None
         st.session_state.login_time = None
+        st.session_state._role_check_ts = 0
 
         # Clear any cached data
         if 'log_data' in st.session_state:
             st.session_state.log_data = None
+        st.session_state.pop('prepared_log_data', None)
 
         st.success("You have been logged out.")
         st.rerun()
@@ -228,13 +413,15 @@ def check_user_role(required_role):
     if not st.session_state.logged_in:
         return False
 
-    # Check session validity
-    if not check_session_validity():
+    # Admin role has access to everything; any other role must match exactly.
+    # Compare roles before touching the session so a mismatch needs no refresh.
+    user_role = st.session_state.user_role
+    if user_role != 'admin' and user_role != required_role:
         return False
 
-    # Admin role has access to everything
-    if st.session_state.user_role == 'admin':
-        return True
-
-    # Check if user role matches required role
-    return st.session_state.user_role == required_role
+    # Check session validity, reusing the result for repeated checks in the same run
+    now = time.time()
+    if now - st.session_state.setdefault('_role_check_ts', 0) >= ROLE_CHECK_TTL:
+        st.session_state._role_check_result = check_session_validity()
+        st.session_state._role_check_ts = now
+    return st.session_state._role_check_result
@@ -2,144 +2,91 @@
 Configuration settings for the Log Analyzer application.
 """
 import os
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Tuple
+
+try:
+    import tomllib
+    TOMLLIB_AVAILABLE = True
+except ImportError:
+    try:
+        import tomli as tomllib
+        TOMLLIB_AVAILABLE = True
+    except ImportError:
+        TOMLLIB_AVAILABLE = False
+
+__all__ = (
+    "APP_NAME", "APP_VERSION", "DEBUG",
+    "DEFAULT_LOG_DIR", "EXAMPLE_LOG_FILE", "DEFAULT_LOG_DIR_AVAILABLE", "PATHS",
+    "LogTypeSpec", "LOG_TYPES", "LOG_TYPE_SUMMARIES", "UNKNOWN_LOG_TYPE", "COLUMN_TO_TYPES", "get_log_type",
+    "SYSLOG_LINE_PATTERN", "CLF_LINE_PATTERN",
+    "CHART_WIDTH", "CHART_HEIGHT", "COLOR_SCHEME",
+    "AUTH_TIMEOUT", "MIN_PASSWORD_LENGTH",
+    "Theme", "LIGHT_THEME", "DARK_THEME", "THEME_COLORS",
+    "DEFAULT_THEME", "DEFAULT_CHART_TYPE", "DEFAULT_LOG_TYPE",
+    "CACHE_DIR", "CACHE_EXPIRATION", "MAX_CACHE_SIZE",
+    "load_config_dict", "load_config_file",
+)
 
 # Application settings
 APP_NAME = "Log Analyzer"
 APP_VERSION = "1.0.0"
-DEBUG = True
-
-# File paths
-DEFAULT_LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "research_results", "test_data")
-EXAMPLE_LOG_FILE = os.path.join(DEFAULT_LOG_DIR, "browsing_logs_5000.txt")
-
-# Log types and their column definitions
-LOG_TYPES = {
-    "browsing": {
-        "columns": [
-            "timestamp", "ip_address", "username", "url",
-            "bandwidth", "status_code", "content_type",
-            "category", "device_info"
-        ],
-        "datetime_format": "%Y%m%d%H%M%S",  # If timestamp needs parsing
-        "separator": " ",
-        "description": "Web browsing logs with URLs and HTTP status codes"
-    },
-    "virus": {
-        "columns": [
-            "timestamp", "ip_address", "username", "virus_name",
-            "file_path", "action_taken", "scan_engine", "severity"
-        ],
-        "datetime_format": "%Y%m%d%H%M%S",
-        "separator": " ",
-        "description": "Antivirus detection logs with virus information"
-    },
-    "mail": {
-        "columns": [
-            "timestamp", "sender", "recipient", "subject",
-            "size", "status", "attachment_count", "spam_score"
-        ],
-        "datetime_format": "%Y%m%d%H%M%S",
-        "separator": " ",
-        "description": "Email server logs with message details"
-    },
-    "firewall": {
-        "columns": [
-            "timestamp", "action", "protocol", "src_ip",
-            "src_port", "dst_ip", "dst_port", "interface",
-            "rule_id", "description"
-        ],
-        "datetime_format": "%Y%m%d%H%M%S",
-        "separator": " ",
-        "description": "Firewall logs with connection information"
-    },
-    "auth": {
-        "columns": [
-            "timestamp", "username", "source_ip", "service",
-            "status", "auth_method", "details"
-        ],
-        "datetime_format": "%Y%m%d%H%M%S",
-        "separator": " ",
-        "description": "Authentication logs with login attempts"
-    },
-    "system": {
-        "columns": [
-            "timestamp", "hostname", "service", "pid",
-            "level", "message"
-        ],
-        "datetime_format": "%Y%m%d%H%M%S",
-        "separator": " ",
-        "description": "System logs with service information"
-    },
-    "application": {
-        "columns": [
-            "timestamp", "app_name", "level", "component",
-            "thread_id", "request_id", "message"
-        ],
-        "datetime_format": "%Y%m%d%H%M%S",
-        "separator": " ",
-        "description": "Application logs with debug information"
-    },
-    "ids": {
-        "columns": [
-            "timestamp", "alert_id", "severity", "category",
-            "src_ip", "dst_ip", "protocol", "signature",
-            "description"
-        ],
-        "datetime_format": "%Y%m%d%H%M%S",
-        "separator": " ",
-        "description": "Intrusion detection system logs"
-    },
-    "vpn": {
-        "columns": [
-            "timestamp", "username", "client_ip", "session_id",
-            "event_type", "duration", "bytes_in", "bytes_out"
-        ],
-        "datetime_format": "%Y%m%d%H%M%S",
-        "separator": " ",
-        "description": "VPN connection logs with session details"
-    },
-    "syslog": {
-        "columns": [
-            "timestamp", "hostname", "process", "pid", "message"
-        ],
-        "datetime_format": "%b %d %H:%M:%S",
-        "separator": " ",
-        "description": "Standard syslog format logs"
-    },
-    "clf": {
-        "columns": [
-            "host", "ident", "authuser", "timestamp", "method",
-            "path", "protocol", "status", "bytes_sent", "url"
-        ],
-        "datetime_format": "%d/%b/%Y:%H:%M:%S %z",
-        "separator": " ",
-        "description": "Common Log Format (CLF) web server logs"
-    },
-    "elf": {
-        "columns": [],  # Columns are determined from the #Fields directive
-        "datetime_format": "%Y-%m-%d %H:%M:%S",
-        "separator": " ",
-        "description": "Extended Log Format (ELF) web server logs"
-    },
-    "json": {
-        "columns": [],  # Columns are determined from the JSON structure
-        "datetime_format": "%Y-%m-%d %H:%M:%S",
-        "separator": "",
-        "description": "JSON structured logs"
-    },
-    "xml": {
-        "columns": [],  # Columns are determined from the XML structure
-        "datetime_format": "%Y-%m-%d %H:%M:%S",
-        "separator": "",
-        "description": "XML structured logs"
-    },
-    "csv": {
-        "columns": [],  # Columns are determined from the CSV header
-        "datetime_format": "%Y-%m-%d %H:%M:%S",
-        "separator": ",",
-        "description": "CSV structured logs"
-    }
-}
+DEBUG: bool = os.environ.get("LOG_ANALYZER_DEBUG") == "1"  # Set LOG_ANALYZER_DEBUG=1 to enable
+
+# File paths (the base directory is resolved once; abspath costs a getcwd call)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_LOG_DIR = os.path.join(_ROOT, "research_results", "test_data")
+_EXAMPLE_LOG_NAME = "browsing_logs_5000.txt"
+EXAMPLE_LOG_FILE = os.path.join(DEFAULT_LOG_DIR, _EXAMPLE_LOG_NAME)
+
+# Log type names and descriptions, in menu order. Kept here, apart from the full specs in
+# config_logtypes, so the UI can list log types without building the registry
+LOG_TYPE_SUMMARIES: Tuple[Tuple[str, str], ...] = (
+    ("browsing", "Web browsing logs with URLs and HTTP status codes"),
+    ("virus", "Antivirus detection logs with virus information"),
+    ("mail", "Email server logs with message details"),
+    ("firewall", "Firewall logs with connection information"),
+    ("auth", "Authentication logs with login attempts"),
+    ("system", "System logs with service information"),
+    ("application", "Application logs with debug information"),
+    ("ids", "Intrusion detection system logs"),
+    ("vpn", "VPN connection logs with session details"),
+    ("syslog", "Standard syslog format logs"),
+    ("clf", "Common Log Format (CLF) web server logs"),
+    ("elf", "Extended Log Format (ELF) web server logs"),
+    ("json", "JSON structured logs"),
+    ("xml", "XML structured logs"),
+    ("csv", "CSV structured logs"),
+)
+
+# Log type registry, imported from config_logtypes on first access by __getattr__ below
+_LOG_TYPE_NAMES = frozenset({
+    "LogTypeSpec", "LOG_TYPES", "UNKNOWN_LOG_TYPE", "COLUMN_TO_TYPES", "get_log_type",
+    "SYSLOG_LINE_PATTERN", "CLF_LINE_PATTERN",
+})
+
+def __dir__():
+    """List the module's names, including the registry names __getattr__ loads on first access."""
+    return sorted(set(globals()) | _LOG_TYPE_NAMES)
+
+def __getattr__(name: str):
+    """
+    Load the log type registry names from config_logtypes on first access (PEP 562).
+
+    Each name is then kept as a module global, so later lookups skip this hook.
+
+    Args:
+        name: Attribute looked up on the module
+
+    Returns:
+        The registry object with that name
+    """
+    if name in _LOG_TYPE_NAMES:
+        import config_logtypes
+        value = globals()[name] = getattr(config_logtypes, name)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Chart settings
 CHART_WIDTH = 700
@@ -151,28 +98,38 @@ AUTH_TIMEOUT = 3600  # Session timeout in seconds (1 hour)
 MIN_PASSWORD_LENGTH = 8
 
 # UI settings
-THEME_COLORS = {
-    "light": {
-        "background": "#ffffff",
-        "text": "#333333",
-        "primary": "#007acc",
-        "secondary": "#6c757d",
-        "success": "#28a745",
-        "danger": "#dc3545",
-        "warning": "#ffc107",
-        "info": "#17a2b8"
-    },
-    "dark": {
-        "background": "#2c2c2c",
-        "text": "#ffffff",
-        "primary": "#007acc",
-        "secondary": "#6c757d",
-        "success": "#28a745",
-        "danger": "#dc3545",
-        "warning": "#ffc107",
-        "info": "#17a2b8"
-    }
-}
+class Theme(NamedTuple):
+    """Colors of one UI theme."""
+    background: str
+    text: str
+    primary: str
+    secondary: str
+    success: str
+    danger: str
+    warning: str
+    info: str
+
+LIGHT_THEME = Theme(
+    background="#ffffff",
+    text="#333333",
+    primary="#007acc",
+    secondary="#6c757d",
+    success="#28a745",
+    danger="#dc3545",
+    warning="#ffc107",
+    info="#17a2b8"
+)
+DARK_THEME = Theme(
+    background="#2c2c2c",
+    text="#ffffff",
+    primary="#007acc",
+    secondary="#6c757d",
+    success="#28a745",
+    danger="#dc3545",
+    warning="#ffc107",
+    info="#17a2b8"
+)
+THEME_COLORS: Mapping[str, Theme] = MappingProxyType({"light": LIGHT_THEME, "dark": DARK_THEME})
 
 # Default settings
 DEFAULT_THEME = "dark"
@@ -180,6 +137,97 @@ DEFAULT_CHART_TYPE = "bar"
 DEFAULT_LOG_TYPE = "browsing"
 
 # Cache settings
-CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache")
+CACHE_DIR = os.path.join(_ROOT, "cache")
 CACHE_EXPIRATION = 3600  # Cache expiration time in seconds (1 hour)
 MAX_CACHE_SIZE = 100 * 1024 * 1024  # Maximum cache size in bytes (100 MB)
+
+class _Paths:
+    """File checks that are done at most once, on first access rather than at import."""
+
+    @cached_property
+    def example_log_exists(self) -> bool:
+        """Whether the example log file is present (one stat, skipped if its directory is missing)."""
+        if not DEFAULT_LOG_DIR_AVAILABLE and os.path.dirname(EXAMPLE_LOG_FILE) == DEFAULT_LOG_DIR:
+            return False
+        return os.path.isfile(EXAMPLE_LOG_FILE)
+
+# Settings that load_config_dict/load_config_file may override, with their defaults.
+# Overrides rebind these module globals, so apply them at startup, before other
+# modules copy a setting with "from config import ..."
+_STATE: Dict[str, Any] = {
+    "DEBUG": DEBUG,
+    "DEFAULT_LOG_DIR": DEFAULT_LOG_DIR,
+    "EXAMPLE_LOG_FILE": None,  # None: the example log inside DEFAULT_LOG_DIR
+    "CHART_WIDTH": CHART_WIDTH,
+    "CHART_HEIGHT": CHART_HEIGHT,
+    "COLOR_SCHEME": COLOR_SCHEME,
+    "AUTH_TIMEOUT": AUTH_TIMEOUT,
+    "MIN_PASSWORD_LENGTH": MIN_PASSWORD_LENGTH,
+    "DEFAULT_THEME": DEFAULT_THEME,
+    "DEFAULT_CHART_TYPE": DEFAULT_CHART_TYPE,
+    "DEFAULT_LOG_TYPE": DEFAULT_LOG_TYPE,
+    "CACHE_DIR": CACHE_DIR,
+    "CACHE_EXPIRATION": CACHE_EXPIRATION,
+    "MAX_CACHE_SIZE": MAX_CACHE_SIZE,
+}
+
+# Parsed config files keyed by (path, modification time), so reloading an unchanged file is free
+_FILE_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+def _rebuild_derived() -> None:
+    """
+    Publish _STATE as module globals and recompute the settings derived from it.
+    """
+    global DEFAULT_LOG_DIR_AVAILABLE, EXAMPLE_LOG_FILE, PATHS
+    globals().update(_STATE)
+
+    # The example log follows DEFAULT_LOG_DIR unless it was overridden itself
+    if EXAMPLE_LOG_FILE is None:
+        EXAMPLE_LOG_FILE = os.path.join(DEFAULT_LOG_DIR, _EXAMPLE_LOG_NAME)
+
+    # Create the cache directory; read-only deployments just run without it
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+    except OSError:
+        pass
+
+    # The log directory holds user data, so it is only checked, never created
+    DEFAULT_LOG_DIR_AVAILABLE = os.path.isdir(DEFAULT_LOG_DIR)
+    PATHS = _Paths()
+
+def load_config_dict(overrides: Mapping[str, Any]) -> None:
+    """
+    Override settings from a mapping of setting names to values.
+
+    Args:
+        overrides: Setting names (as in _STATE, e.g. "CHART_WIDTH") and their new values
+
+    Raises:
+        KeyError: If a name is not an overridable setting
+    """
+    unknown = set(overrides) - set(_STATE)
+    if unknown:
+        raise KeyError(f"Unknown config settings: {', '.join(sorted(unknown))}")
+    _STATE.update(overrides)
+    _rebuild_derived()
+
+def load_config_file(path: str) -> None:
+    """
+    Override settings from a TOML file of top-level setting names and values.
+
+    The parsed file is cached by path and modification time, so calling this again
+    with an unchanged file does not re-read it.
+
+    Args:
+        path: Path to the TOML file
+    """
+    if not TOMLLIB_AVAILABLE:
+        raise ImportError("Loading config files requires Python 3.11+ or the tomli package")
+    key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+    overrides = _FILE_CACHE.get(key)
+    if overrides is None:
+        with open(path, "rb") as f:
+            overrides = _FILE_CACHE[key] = tomllib.load(f)
+    load_config_dict(overrides)
+
+_rebuild_derived()
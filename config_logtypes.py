@@ -0,0 +1,304 @@
+"""
+Log type registry for the Log Analyzer application.
+
+Kept out of config.py so that importers needing only settings (app name, chart sizes,
+paths) don't build it: config's module __getattr__ imports this module on first access
+to LOG_TYPES or another registry name.
+"""
+import re
+import sys
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Mapping, NamedTuple, Optional, Tuple
+
+from config import LOG_TYPE_SUMMARIES
+
+# Log types and their column definitions
+class LogTypeSpec(NamedTuple):
+    """Column layout and parsing settings of one log type."""
+    columns: Tuple[str, ...]
+    datetime_format: str
+    separator: str
+    description: str = ""  # Filled in from LOG_TYPE_SUMMARIES
+    split_line: Optional[Callable[[str], Any]] = None  # Field list, or a re.Match for regex-parsed types
+    parse_line: Optional[Callable[[str], Dict[str, str]]] = None  # Line to {column: field}, delimited types only
+    parse_timestamp: Optional[Callable[[str], datetime]] = None  # Bound to datetime_format by _compile_spec
+
+# Field extraction for syslog (Month Day Time Hostname Process[PID]: Message) and
+# CLF (host ident authuser [date] "request" status bytes) lines
+SYSLOG_LINE_PATTERN = re.compile(r'^(\w{3} [ 0-9]\d \d{2}:\d{2}:\d{2}) (\S+) (\S+)(?:\[(\d+)\])?: (.*)$')
+CLF_LINE_PATTERN = re.compile(r'^(\S+) (\S+) (\S+) \[([^]]+)\] "([^"]*)" (\d+) (\d+)$')
+
+_MONTHS = {name: number for number, name in enumerate(
+    ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), start=1)}
+
+def _parse_syslog_timestamp(value: str) -> datetime:
+    """
+    Parse a fixed-width syslog timestamp ("Sep  1 12:34:56", %b %d %H:%M:%S) by slicing.
+
+    Args:
+        value: Timestamp text
+
+    Returns:
+        datetime: Parsed timestamp in year 1900, as strptime gives without a year
+    """
+    month = _MONTHS.get(value[:3])
+    if month is None or len(value) != 15 or value[3] != " " or value[9] != ":" or value[12] != ":":
+        return datetime.strptime(value, "%b %d %H:%M:%S")
+    return datetime(1900, month, int(value[4:6]),
+                    int(value[7:9]), int(value[10:12]), int(value[13:15]))
+
+def _parse_clf_timestamp(value: str) -> datetime:
+    """
+    Parse a fixed-width CLF timestamp ("10/Oct/2000:13:55:36 -0700", %d/%b/%Y:%H:%M:%S %z) by slicing.
+
+    Args:
+        value: Timestamp text
+
+    Returns:
+        datetime: Timezone-aware parsed timestamp
+    """
+    month = _MONTHS.get(value[3:6])
+    if (month is None or len(value) != 26 or value[2] != "/" or value[6] != "/"
+            or value[20] != " " or value[21] not in "+-"):
+        return datetime.strptime(value, "%d/%b/%Y:%H:%M:%S %z")
+    offset = timedelta(hours=int(value[22:24]), minutes=int(value[24:26]))
+    return datetime(int(value[7:11]), month, int(value[:2]),
+                    int(value[12:14]), int(value[15:17]), int(value[18:20]),
+                    tzinfo=timezone(-offset if value[21] == "-" else offset))
+
+# Hand-rolled parsers for the fixed-width formats that dominate real log volumes
+_FIXED_WIDTH_PARSERS = {
+    "%b %d %H:%M:%S": _parse_syslog_timestamp,
+    "%d/%b/%Y:%H:%M:%S %z": _parse_clf_timestamp,
+}
+
+def _make_line_parser(columns: Tuple[str, ...], separator: str) -> Callable[[str], Dict[str, str]]:
+    """
+    Generate a line parser specialised to a fixed column layout.
+
+    The column count and names are constants per log type, so the parser is generated
+    with the tuple unpacking and the dict display written out, instead of zipping the
+    columns with the fields for every line. Lines with fewer fields than columns fall
+    back to the zip and only fill the columns they have.
+
+    Args:
+        columns: Column names, in field order
+        separator: Field separator
+
+    Returns:
+        Callable[[str], Dict[str, str]]: Function mapping a line to {column: field}
+    """
+    names = [f"f{i}" for i in range(len(columns))]
+    source = (
+        "def parse_line(line, _split=str.split, _columns=columns):\n"
+        f"    fields = _split(line, {separator!r}, {len(columns) - 1})\n"
+        f"    if len(fields) == {len(columns)}:\n"
+        f"        {', '.join(names)}, = fields\n"
+        "        return {" + ", ".join(f"{column!r}: {name}" for column, name in zip(columns, names)) + "}\n"
+        "    return dict(zip(_columns, fields))\n"
+    )
+    namespace = {"columns": columns}
+    exec(compile(source, f"<parse_line {' '.join(columns)}>", "exec"), namespace)
+    return namespace["parse_line"]
+
+def _compile_spec(spec: LogTypeSpec) -> LogTypeSpec:
+    """
+    Finish a log type spec: intern its strings and attach a line splitter and a timestamp parser.
+
+    Column names recur across log types; interning makes every spec share one str per name,
+    so dict lookups keyed by column name hit the identity fast path. The intern table is the
+    column name pool: each columns tuple is just pointers into it, about the size an
+    array('H') of pool indices would be, without an index lookup per access.
+
+    Delimited types without their own splitter split on the separator at most
+    len(columns) - 1 times, leaving the rest of the line in the last field, and get a
+    generated parse_line (see _make_line_parser).
+
+    Args:
+        spec: Log type spec as written in the registry
+
+    Returns:
+        LogTypeSpec: The spec with interned strings, split_line, parse_line and parse_timestamp set
+    """
+    columns = tuple(sys.intern(column) for column in spec.columns)
+    separator = sys.intern(spec.separator)
+    split_line, parse_line = spec.split_line, None
+    if split_line is None and columns and separator:
+        split_line = partial(str.split, sep=separator, maxsplit=len(columns) - 1)
+        parse_line = _make_line_parser(columns, separator)
+
+    fmt = sys.intern(spec.datetime_format)
+    parser = _FIXED_WIDTH_PARSERS.get(fmt)
+    if parser is None:
+        def parser(value: str, _fmt: str = fmt, _strptime=datetime.strptime) -> datetime:
+            return _strptime(value, _fmt)
+    return spec._replace(columns=columns, datetime_format=fmt, separator=separator,
+                         split_line=split_line, parse_line=parse_line, parse_timestamp=parser)
+
+# Settings used for a log type missing from LOG_TYPES
+UNKNOWN_LOG_TYPE = _compile_spec(LogTypeSpec(columns=(), datetime_format="%Y%m%d%H%M%S", separator=" "))
+
+# The registry is not cached on disk: its column tuples and strings are constants that the
+# interpreter already loads from this module's marshalled .pyc, and the rest of the build
+# (~1ms, mostly compiling the generated line parsers) runs once per process, on first use
+def _build_log_types() -> Mapping[str, LogTypeSpec]:
+    """
+    Build the log type registry.
+
+    Returns:
+        Mapping[str, LogTypeSpec]: Read-only mapping of log type name to its spec; specs are
+        immutable and column layouts are tuples shared by every parser
+    """
+    specs = {
+        "browsing": LogTypeSpec(
+            columns=(
+                "timestamp", "ip_address", "username", "url",
+                "bandwidth", "status_code", "content_type",
+                "category", "device_info"
+            ),
+            datetime_format="%Y%m%d%H%M%S",  # If timestamp needs parsing
+            separator=" "
+        ),
+        "virus": LogTypeSpec(
+            columns=(
+                "timestamp", "ip_address", "username", "virus_name",
+                "file_path", "action_taken", "scan_engine", "severity"
+            ),
+            datetime_format="%Y%m%d%H%M%S",
+            separator=" "
+        ),
+        "mail": LogTypeSpec(
+            columns=(
+                "timestamp", "sender", "recipient", "subject",
+                "size", "status", "attachment_count", "spam_score"
+            ),
+            datetime_format="%Y%m%d%H%M%S",
+            separator=" "
+        ),
+        "firewall": LogTypeSpec(
+            columns=(
+                "timestamp", "action", "protocol", "src_ip",
+                "src_port", "dst_ip", "dst_port", "interface",
+                "rule_id", "description"
+            ),
+            datetime_format="%Y%m%d%H%M%S",
+            separator=" "
+        ),
+        "auth": LogTypeSpec(
+            columns=(
+                "timestamp", "username", "source_ip", "service",
+                "status", "auth_method", "details"
+            ),
+            datetime_format="%Y%m%d%H%M%S",
+            separator=" "
+        ),
+        "system": LogTypeSpec(
+            columns=(
+                "timestamp", "hostname", "service", "pid",
+                "level", "message"
+            ),
+            datetime_format="%Y%m%d%H%M%S",
+            separator=" "
+        ),
+        "application": LogTypeSpec(
+            columns=(
+                "timestamp", "app_name", "level", "component",
+                "thread_id", "request_id", "message"
+            ),
+            datetime_format="%Y%m%d%H%M%S",
+            separator=" "
+        ),
+        "ids": LogTypeSpec(
+            columns=(
+                "timestamp", "alert_id", "severity", "category",
+                "src_ip", "dst_ip", "protocol", "signature",
+                "description"
+            ),
+            datetime_format="%Y%m%d%H%M%S",
+            separator=" "
+        ),
+        "vpn": LogTypeSpec(
+            columns=(
+                "timestamp", "username", "client_ip", "session_id",
+                "event_type", "duration", "bytes_in", "bytes_out"
+            ),
+            datetime_format="%Y%m%d%H%M%S",
+            separator=" "
+        ),
+        "syslog": LogTypeSpec(
+            columns=(
+                "timestamp", "hostname", "process", "pid", "message"
+            ),
+            datetime_format="%b %d %H:%M:%S",
+            separator=" ",
+            split_line=SYSLOG_LINE_PATTERN.match
+        ),
+        "clf": LogTypeSpec(
+            columns=(
+                "host", "ident", "authuser", "timestamp", "method",
+                "path", "protocol", "status", "bytes_sent", "url"
+            ),
+            datetime_format="%d/%b/%Y:%H:%M:%S %z",
+            separator=" ",
+            split_line=CLF_LINE_PATTERN.match
+        ),
+        "elf": LogTypeSpec(
+            columns=(),  # Columns are determined from the #Fields directive
+            datetime_format="%Y-%m-%d %H:%M:%S",
+            separator=" "
+        ),
+        "json": LogTypeSpec(
+            columns=(),  # Columns are determined from the JSON structure
+            datetime_format="%Y-%m-%d %H:%M:%S",
+            separator=""
+        ),
+        "xml": LogTypeSpec(
+            columns=(),  # Columns are determined from the XML structure
+            datetime_format="%Y-%m-%d %H:%M:%S",
+            separator=""
+        ),
+        "csv": LogTypeSpec(
+            columns=(),  # Columns are determined from the CSV header
+            datetime_format="%Y-%m-%d %H:%M:%S",
+            separator=","
+        )
+    }
+    return MappingProxyType({name: _compile_spec(specs[name]._replace(description=description))
+                             for name, description in LOG_TYPE_SUMMARIES})
+
+def _build_column_index(log_types: Mapping[str, LogTypeSpec]) -> Mapping[str, FrozenSet[str]]:
+    """
+    Build the inverted index from column name to the log types that have the column.
+
+    Args:
+        log_types: Log type registry
+
+    Returns:
+        Mapping[str, FrozenSet[str]]: Read-only mapping of column name to log type names
+    """
+    index = defaultdict(set)
+    for name, spec in log_types.items():
+        for column in spec.columns:
+            index[column].add(name)
+    return MappingProxyType({column: frozenset(names) for column, names in index.items()})
+
+def get_log_type(name: str) -> LogTypeSpec:
+    """
+    Get the spec of a log type.
+
+    Args:
+        name: Log type name
+
+    Returns:
+        LogTypeSpec: Spec of the log type
+
+    Raises:
+        KeyError: If the log type is unknown
+    """
+    return LOG_TYPES[name]
+
+LOG_TYPES = _build_log_types()
+COLUMN_TO_TYPES = _build_column_index(LOG_TYPES)
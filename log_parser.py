@@ -15,9 +15,44 @@ import csv
 from datetime import datetime
 from typing import List, Optional
 
-from config import LOG_TYPES, DEFAULT_LOG_TYPE
+# Registry names (LOG_TYPES, ...) are read as config attributes, so the registry is built on first use
+import config
+from config import DEFAULT_LOG_TYPE
 from utils import detect_log_type, format_timestamp
 
+# Structured formats recognised from the first line
+CLF_PATTERN = re.compile(r'^\S+ \S+ \S+ \[\d+/\w+/\d+:\d+:\d+:\d+ [+-]\d+\] "\S+ \S+ \S+" \d+ \d+$')
+SYSLOG_PATTERN = re.compile(r'^\w{3} [ 0-9]\d \d{2}:\d{2}:\d{2} \S+ \S+(\[\d+\])?:')
+
+# Keyword patterns for content-based detection, checked in order; a line must match
+# every pattern of a log type to select it
+CONTENT_PATTERNS = [
+    ("browsing", [re.compile(r'https?://|www\.|\.(com|org|net|edu|gov)'), re.compile(r'\b[1-5][0-9]{2}\b')]),
+    ("virus", [re.compile(r'virus|malware|trojan|infected|quarantine', re.IGNORECASE)]),
+    ("mail", [re.compile(r'@|sender|recipient|subject|spam|mail', re.IGNORECASE)]),
+    ("firewall", [re.compile(r'firewall|allow|deny|block|accept|drop|src|dst|port', re.IGNORECASE)]),
+    ("auth", [re.compile(r'login|logout|auth|failed|success|user|password|session', re.IGNORECASE)]),
+    ("system", [re.compile(r'system|kernel|daemon|cron|service|start|stop|restart', re.IGNORECASE)]),
+    ("application", [re.compile(r'error|warning|info|debug|trace|exception|stack', re.IGNORECASE)]),
+    ("ids", [re.compile(r'intrusion|detection|prevention|alert|signature|attack', re.IGNORECASE)]),
+    ("vpn", [re.compile(r'vpn|tunnel|connect|disconnect|remote|client', re.IGNORECASE)]),
+]
+
+def _match_content_type(line: str) -> Optional[str]:
+    """
+    Find the first log type whose keyword patterns all match a line.
+
+    Args:
+        line: Log line to check
+
+    Returns:
+        Optional[str]: Matching log type, or None if no patterns match
+    """
+    for log_type, patterns in CONTENT_PATTERNS:
+        if all(pattern.search(line) for pattern in patterns):
+            return log_type
+    return None
+
 class LogParser:
     """Class for parsing and processing log files of different formats."""
 
@@ -30,9 +65,16 @@ class LogParser:
                      If None, the parser will attempt to detect the log type.
         """
         self.log_type = log_type or DEFAULT_LOG_TYPE
-        self.columns = LOG_TYPES.get(self.log_type, {}).get("columns", [])
-        self.separator = LOG_TYPES.get(self.log_type, {}).get("separator", " ")
-        self.datetime_format = LOG_TYPES.get(self.log_type, {}).get("datetime_format", "%Y%m%d%H%M%S")
+        self._load_log_type_settings()
+
+    def _load_log_type_settings(self) -> None:
+        """Set the columns, separator and datetime format from the current log type's spec."""
+        spec = config.LOG_TYPES.get(self.log_type, config.UNKNOWN_LOG_TYPE)
+        self.columns = spec.columns
+        self.separator = spec.separator
+        self.split_line = spec.split_line
+        self.parse_line = spec.parse_line
+        self.datetime_format = spec.datetime_format
 
     def parse_file(self, file_path: str) -> pd.DataFrame:
         """
@@ -50,9 +92,7 @@ class LogParser:
                 detected_type = detect_log_type(file_path)
                 if detected_type != self.log_type:
                     self.log_type = detected_type
-                    self.columns = LOG_TYPES.get(self.log_type, {}).get("columns", [])
-                    self.separator = LOG_TYPES.get(self.log_type, {}).get("separator", " ")
-                    self.datetime_format = LOG_TYPES.get(self.log_type, {}).get("datetime_format", "%Y%m%d%H%M%S")
+                    self._load_log_type_settings()
 
             # Detect file format and read accordingly
             file_format = self._detect_file_format(file_path)
@@ -440,8 +480,7 @@ class LogParser:
                 pass
 
         # Check for Common Log Format (CLF)
-        clf_pattern = r'^\S+ \S+ \S+ \[\d+/\w+/\d+:\d+:\d+:\d+ [+-]\d+\] "\S+ \S+ \S+" \d+ \d+$'
-        if sample_lines and re.match(clf_pattern, sample_lines[0].strip()):
+        if sample_lines and CLF_PATTERN.match(sample_lines[0].strip()):
             self.log_type = "clf"
             return
 
@@ -451,62 +490,19 @@ class LogParser:
             return
 
         # Check for Syslog format
-        syslog_pattern = r'^\w{3} [ 0-9]\d \d{2}:\d{2}:\d{2} \S+ \S+(\[\d+\])?:'
-        if sample_lines and re.match(syslog_pattern, sample_lines[0].strip()):
+        if sample_lines and SYSLOG_PATTERN.match(sample_lines[0].strip()):
             self.log_type = "syslog"
             return
 
         # If no structured format detected, fall back to content-based detection for log types
         for line in sample_lines:
-            # Check for browsing log patterns (URLs, HTTP status codes)
-            if re.search(r'https?://|www\.|\.(com|org|net|edu|gov)', line) and re.search(r'\b[1-5][0-9]{2}\b', line):
-                self.log_type = "browsing"
-                break
-
-            # Check for virus log patterns
-            if re.search(r'virus|malware|trojan|infected|quarantine', line, re.IGNORECASE):
-                self.log_type = "virus"
-                break
-
-            # Check for mail log patterns
-            if re.search(r'@|sender|recipient|subject|spam|mail', line, re.IGNORECASE):
-                self.log_type = "mail"
-                break
-
-            # Check for firewall log patterns
-            if re.search(r'firewall|allow|deny|block|accept|drop|src|dst|port', line, re.IGNORECASE):
-                self.log_type = "firewall"
-                break
-
-            # Check for authentication log patterns
-            if re.search(r'login|logout|auth|failed|success|user|password|session', line, re.IGNORECASE):
-                self.log_type = "auth"
-                break
-
-            # Check for system log patterns
-            if re.search(r'system|kernel|daemon|cron|service|start|stop|restart', line, re.IGNORECASE):
-                self.log_type = "system"
-                break
-
-            # Check for application log patterns
-            if re.search(r'error|warning|info|debug|trace|exception|stack', line, re.IGNORECASE):
-                self.log_type = "application"
-                break
-
-            # Check for IDS/IPS log patterns
-            if re.search(r'intrusion|detection|prevention|alert|signature|attack', line, re.IGNORECASE):
-                self.log_type = "ids"
-                break
-
-            # Check for VPN log patterns
-            if re.search(r'vpn|tunnel|connect|disconnect|remote|client', line, re.IGNORECASE):
-                self.log_type = "vpn"
+            detected_type = _match_content_type(line)
+            if detected_type:
+                self.log_type = detected_type
                 break
 
         # Update parser settings based on detected log type
-        self.columns = LOG_TYPES.get(self.log_type, {}).get("columns", [])
-        self.separator = LOG_TYPES.get(self.log_type, {}).get("separator", " ")
-        self.datetime_format = LOG_TYPES.get(self.log_type, {}).get("datetime_format", "%Y%m%d%H%M%S")
+        self._load_log_type_settings()
 
     def _detect_log_type_from_content(self, sample_lines: List[str]) -> None:
         """
@@ -517,55 +513,77 @@ class LogParser:
         """
         # Check for patterns in the sample lines
         for line in sample_lines:
-            # Check for browsing log patterns (URLs, HTTP status codes)
-            if re.search(r'https?://|www\.|\.(com|org|net|edu|gov)', line) and re.search(r'\b[1-5][0-9]{2}\b', line):
-                self.log_type = "browsing"
+            detected_type = _match_content_type(line)
+            if detected_type:
+                self.log_type = detected_type
                 break
 
-            # Check for virus log patterns
-            if re.search(r'virus|malware|trojan|infected|quarantine', line, re.IGNORECASE):
-                self.log_type = "virus"
-                break
+        # Update parser settings based on detected log type
+        self._load_log_type_settings()
 
-            # Check for mail log patterns
-            if re.search(r'@|sender|recipient|subject|spam|mail', line, re.IGNORECASE):
-                self.log_type = "mail"
-                break
+    def _parse_fixed_fields(self, lines: List[str], log_type: str) -> pd.DataFrame:
+        """
+        Parse whitespace-delimited logs with a fixed set of fields.
 
-            # Check for firewall log patterns
-            if re.search(r'firewall|allow|deny|block|accept|drop|src|dst|port', line, re.IGNORECASE):
-                self.log_type = "firewall"
-                break
+        The last field keeps the rest of the line, and lines with fewer fields than
+        the log type defines are skipped.
 
-            # Check for authentication log patterns
-            if re.search(r'login|logout|auth|failed|success|user|password|session', line, re.IGNORECASE):
-                self.log_type = "auth"
-                break
+        Args:
+            lines: Lines from the log file
+            log_type: Log type whose columns define the fields
 
-            # Check for system log patterns
-            if re.search(r'system|kernel|daemon|cron|service|start|stop|restart', line, re.IGNORECASE):
-                self.log_type = "system"
-                break
+        Returns:
+            pd.DataFrame: DataFrame with the formatted timestamp, the raw timestamp and the remaining fields
+        """
+        columns = config.LOG_TYPES[log_type].columns
+        n_fields = len(columns)
+
+        fields = self._read_whitespace_fields(lines, n_fields)
+        if fields is None:
+            # Some lines carry extra whitespace-separated words in the last field
+            rows = [parts for parts in (line.strip().split(maxsplit=n_fields - 1) for line in lines)
+                    if len(parts) >= n_fields]
+            fields = [list(values) for values in zip(*rows)]
+        if not fields or not fields[0]:
+            return pd.DataFrame()
 
-            # Check for application log patterns
-            if re.search(r'error|warning|info|debug|trace|exception|stack', line, re.IGNORECASE):
-                self.log_type = "application"
-                break
+        # Format each distinct timestamp once
+        raw_timestamps = fields[0]
+        formatted = {timestamp: format_timestamp(timestamp, log_type) for timestamp in set(raw_timestamps)}
+        data = {
+            "timestamp": [formatted[timestamp] for timestamp in raw_timestamps],
+            "raw_timestamp": raw_timestamps,
+        }
+        data.update(zip(columns[1:], fields[1:]))
 
-            # Check for IDS/IPS log patterns
-            if re.search(r'intrusion|detection|prevention|alert|signature|attack', line, re.IGNORECASE):
-                self.log_type = "ids"
-                break
+        return pd.DataFrame(data)
 
-            # Check for VPN log patterns
-            if re.search(r'vpn|tunnel|connect|disconnect|remote|client', line, re.IGNORECASE):
-                self.log_type = "vpn"
-                break
+    def _read_whitespace_fields(self, lines: List[str], n_fields: int) -> Optional[List[list]]:
+        """
+        Split lines into exactly n_fields whitespace-separated fields with pandas' C parser.
 
-        # Update parser settings based on detected log type
-        self.columns = LOG_TYPES.get(self.log_type, {}).get("columns", [])
-        self.separator = LOG_TYPES.get(self.log_type, {}).get("separator", " ")
-        self.datetime_format = LOG_TYPES.get(self.log_type, {}).get("datetime_format", "%Y%m%d%H%M%S")
+        Args:
+            lines: Lines from the log file
+            n_fields: Number of fields per line
+
+        Returns:
+            Optional[List[list]]: One list of strings per field, or None if any line has more fields
+        """
+        # Cheap check on a sample first, so ragged logs don't pay for a failed parse
+        if any(len(line.split(maxsplit=n_fields)) > n_fields for line in lines[:100]):
+            return None
+
+        try:
+            df = pd.read_csv(io.StringIO("\n".join(lines)), sep=r'\s+', header=None, names=range(n_fields),
+                             dtype=str, na_filter=False, quoting=csv.QUOTE_NONE, engine='c')
+        except (pd.errors.ParserError, pd.errors.EmptyDataError):
+            return None
+
+        # Short lines are padded with empty fields; skip them like the split-based parser does
+        complete = df[n_fields - 1] != ""
+        if not complete.all():
+            df = df[complete]
+        return [df[i].tolist() for i in range(n_fields)]
 
     def _parse_browsing_logs(self, lines: List[str]) -> pd.DataFrame:
         """
@@ -577,35 +595,7 @@ class LogParser:
         Returns:
             pd.DataFrame: DataFrame containing the parsed browsing log data
         """
-        data = []
-
-        for line in lines:
-            # Split the line into parts
-            parts = line.strip().split(maxsplit=8)  # Split into 9 parts max
-
-            if len(parts) >= 9:
-                # Extract the parts into variables
-                timestamp, ip_address, username, url, bandwidth, status_code, content_type, category, device_info = parts
-
-                # Format the timestamp
-                formatted_timestamp = format_timestamp(timestamp, "browsing")
-
-                # Add the data to the list
-                data.append({
-                    "timestamp": formatted_timestamp,
-                    "raw_timestamp": timestamp,
-                    "ip_address": ip_address,
-                    "username": username,
-                    "url": url,
-                    "bandwidth": bandwidth,
-                    "status_code": status_code,
-                    "content_type": content_type,
-                    "category": category,
-                    "device_info": device_info
-                })
-
-        # Create a DataFrame from the data
-        df = pd.DataFrame(data)
+        df = self._parse_fixed_fields(lines, "browsing")
 
         # Convert numeric columns
         if not df.empty:
@@ -625,38 +615,7 @@ class LogParser:
         Returns:
             pd.DataFrame: DataFrame containing the parsed virus log data
         """
-        # Placeholder for virus log parsing
-        # This would be implemented based on the actual virus log format
-        data = []
-
-        for line in lines:
-            # Split the line into parts
-            parts = line.strip().split(maxsplit=7)  # Adjust based on actual format
-
-            if len(parts) >= 8:
-                # Extract the parts into variables
-                timestamp, ip_address, username, virus_name, file_path, action_taken, scan_engine, severity = parts
-
-                # Format the timestamp
-                formatted_timestamp = format_timestamp(timestamp, "virus")
-
-                # Add the data to the list
-                data.append({
-                    "timestamp": formatted_timestamp,
-                    "raw_timestamp": timestamp,
-                    "ip_address": ip_address,
-                    "username": username,
-                    "virus_name": virus_name,
-                    "file_path": file_path,
-                    "action_taken": action_taken,
-                    "scan_engine": scan_engine,
-                    "severity": severity
-                })
-
-        # Create a DataFrame from the data
-        df = pd.DataFrame(data)
-
-        return df
+        return self._parse_fixed_fields(lines, "virus")
 
     def _parse_mail_logs(self, lines: List[str]) -> pd.DataFrame:
         """
@@ -668,38 +627,7 @@ class LogParser:
         Returns:
             pd.DataFrame: DataFrame containing the parsed mail log data
         """
-        # Placeholder for mail log parsing
-        # This would be implemented based on the actual mail log format
-        data = []
-
-        for line in lines:
-            # Split the line into parts
-            parts = line.strip().split(maxsplit=7)  # Adjust based on actual format
-
-            if len(parts) >= 8:
-                # Extract the parts into variables
-                timestamp, sender, recipient, subject, size, status, attachment_count, spam_score = parts
-
-                # Format the timestamp
-                formatted_timestamp = format_timestamp(timestamp, "mail")
-
-                # Add the data to the list
-                data.append({
-                    "timestamp": formatted_timestamp,
-                    "raw_timestamp": timestamp,
-                    "sender": sender,
-                    "recipient": recipient,
-                    "subject": subject,
-                    "size": size,
-                    "status": status,
-                    "attachment_count": attachment_count,
-                    "spam_score": spam_score
-                })
-
-        # Create a DataFrame from the data
-        df = pd.DataFrame(data)
-
-        return df
+        return self._parse_fixed_fields(lines, "mail")
 
     def _parse_firewall_logs(self, lines: List[str]) -> pd.DataFrame:
         """
@@ -711,38 +639,7 @@ class LogParser:
         Returns:
             pd.DataFrame: DataFrame containing the parsed firewall log data
         """
-        data = []
-
-        for line in lines:
-            # Split the line into parts
-            parts = line.strip().split(maxsplit=9)  # Adjust based on actual format
-
-            if len(parts) >= 10:
-                # Extract the parts into variables
-                timestamp, action, protocol, src_ip, src_port, dst_ip, dst_port, interface, rule_id, description = parts
-
-                # Format the timestamp
-                formatted_timestamp = format_timestamp(timestamp, "firewall")
-
-                # Add the data to the list
-                data.append({
-                    "timestamp": formatted_timestamp,
-                    "raw_timestamp": timestamp,
-                    "action": action,
-                    "protocol": protocol,
-                    "src_ip": src_ip,
-                    "src_port": src_port,
-                    "dst_ip": dst_ip,
-                    "dst_port": dst_port,
-                    "interface": interface,
-                    "rule_id": rule_id,
-                    "description": description
-                })
-
-        # Create a DataFrame from the data
-        df = pd.DataFrame(data)
-
-        return df
+        return self._parse_fixed_fields(lines, "firewall")
 
     def _parse_auth_logs(self, lines: List[str]) -> pd.DataFrame:
         """
@@ -754,35 +651,7 @@ class LogParser:
         Returns:
             pd.DataFrame: DataFrame containing the parsed authentication log data
         """
-        data = []
-
-        for line in lines:
-            # Split the line into parts
-            parts = line.strip().split(maxsplit=6)  # Adjust based on actual format
-
-            if len(parts) >= 7:
-                # Extract the parts into variables
-                timestamp, username, source_ip, service, status, auth_method, details = parts
-
-                # Format the timestamp
-                formatted_timestamp = format_timestamp(timestamp, "auth")
-
-                # Add the data to the list
-                data.append({
-                    "timestamp": formatted_timestamp,
-                    "raw_timestamp": timestamp,
-                    "username": username,
-                    "source_ip": source_ip,
-                    "service": service,
-                    "status": status,
-                    "auth_method": auth_method,
-                    "details": details
-                })
-
-        # Create a DataFrame from the data
-        df = pd.DataFrame(data)
-
-        return df
+        return self._parse_fixed_fields(lines, "auth")
 
     def _parse_system_logs(self, lines: List[str]) -> pd.DataFrame:
         """
@@ -794,34 +663,7 @@ class LogParser:
         Returns:
             pd.DataFrame: DataFrame containing the parsed system log data
         """
-        data = []
-
-        for line in lines:
-            # Split the line into parts
-            parts = line.strip().split(maxsplit=5)  # Adjust based on actual format
-
-            if len(parts) >= 6:
-                # Extract the parts into variables
-                timestamp, hostname, service, pid, level, message = parts
-
-                # Format the timestamp
-                formatted_timestamp = format_timestamp(timestamp, "system")
-
-                # Add the data to the list
-                data.append({
-                    "timestamp": formatted_timestamp,
-                    "raw_timestamp": timestamp,
-                    "hostname": hostname,
-                    "service": service,
-                    "pid": pid,
-                    "level": level,
-                    "message": message
-                })
-
-        # Create a DataFrame from the data
-        df = pd.DataFrame(data)
-
-        return df
+        return self._parse_fixed_fields(lines, "system")
 
     def _parse_application_logs(self, lines: List[str]) -> pd.DataFrame:
         """
@@ -833,35 +675,7 @@ class LogParser:
         Returns:
             pd.DataFrame: DataFrame containing the parsed application log data
         """
-        data = []
-
-        for line in lines:
-            # Split the line into parts
-            parts = line.strip().split(maxsplit=6)  # Adjust based on actual format
-
-            if len(parts) >= 7:
-                # Extract the parts into variables
-                timestamp, app_name, level, component, thread_id, request_id, message = parts
-
-                # Format the timestamp
-                formatted_timestamp = format_timestamp(timestamp, "application")
-
-                # Add the data to the list
-                data.append({
-                    "timestamp": formatted_timestamp,
-                    "raw_timestamp": timestamp,
-                    "app_name": app_name,
-                    "level": level,
-                    "component": component,
-                    "thread_id": thread_id,
-                    "request_id": request_id,
-                    "message": message
-                })
-
-        # Create a DataFrame from the data
-        df = pd.DataFrame(data)
-
-        return df
+        return self._parse_fixed_fields(lines, "application")
 
     def _parse_ids_logs(self, lines: List[str]) -> pd.DataFrame:
         """
@@ -873,37 +687,7 @@ class LogParser:
         Returns:
             pd.DataFrame: DataFrame containing the parsed IDS/IPS log data
         """
-        data = []
-
-        for line in lines:
-            # Split the line into parts
-            parts = line.strip().split(maxsplit=8)  # Adjust based on actual format
-
-            if len(parts) >= 9:
-                # Extract the parts into variables
-                timestamp, alert_id, severity, category, src_ip, dst_ip, protocol, signature, description = parts
-
-                # Format the timestamp
-                formatted_timestamp = format_timestamp(timestamp, "ids")
-
-                # Add the data to the list
-                data.append({
-                    "timestamp": formatted_timestamp,
-                    "raw_timestamp": timestamp,
-                    "alert_id": alert_id,
-                    "severity": severity,
-                    "category": category,
-                    "src_ip": src_ip,
-                    "dst_ip": dst_ip,
-                    "protocol": protocol,
-                    "signature": signature,
-                    "description": description
-                })
-
-        # Create a DataFrame from the data
-        df = pd.DataFrame(data)
-
-        return df
+        return self._parse_fixed_fields(lines, "ids")
 
     def _parse_vpn_logs(self, lines: List[str]) -> pd.DataFrame:
         """
@@ -915,36 +699,7 @@ class LogParser:
         Returns:
             pd.DataFrame: DataFrame containing the parsed VPN log data
         """
-        data = []
-
-        for line in lines:
-            # Split the line into parts
-            parts = line.strip().split(maxsplit=7)  # Adjust based on actual format
-
-            if len(parts) >= 8:
-                # Extract the parts into variables
-                timestamp, username, client_ip, session_id, event_type, duration, bytes_in, bytes_out = parts
-
-                # Format the timestamp
-                formatted_timestamp = format_timestamp(timestamp, "vpn")
-
-                # Add the data to the list
-                data.append({
-                    "timestamp": formatted_timestamp,
-                    "raw_timestamp": timestamp,
-                    "username": username,
-                    "client_ip": client_ip,
-                    "session_id": session_id,
-                    "event_type": event_type,
-                    "duration": duration,
-                    "bytes_in": bytes_in,
-                    "bytes_out": bytes_out
-                })
-
-        # Create a DataFrame from the data
-        df = pd.DataFrame(data)
-
-        return df
+        return self._parse_fixed_fields(lines, "vpn")
 
     def _parse_syslog_format(self, lines: List[str]) -> pd.DataFrame:
         """
@@ -956,29 +711,14 @@ class LogParser:
         Returns:
             pd.DataFrame: DataFrame containing the parsed log data
         """
-        data = []
-
-        # Syslog pattern: Month Day Time Hostname Process[PID]: Message
-        syslog_pattern = r'^(\w{3} [ 0-9]\d \d{2}:\d{2}:\d{2}) (\S+) (\S+)(?:\[(\d+)\])?: (.*)$'
-
-        for line in lines:
-            match = re.match(syslog_pattern, line.strip())
-            if match:
-                timestamp, hostname, process, pid, message = match.groups()
-
-                # Add the data to the list
-                data.append({
-                    "timestamp": timestamp,
-                    "hostname": hostname,
-                    "process": process,
-                    "pid": pid if pid else "",
-                    "message": message
-                })
-
-        # Create a DataFrame from the data
-        df = pd.DataFrame(data)
+        # Missing PIDs become empty strings
+        rows = [match.groups("") for match in map(config.LOG_TYPES["syslog"].split_line, map(str.strip, lines)) if match]
+        if not rows:
+            return pd.DataFrame()
 
-        return df
+        # Build the frame from one list per column rather than one dict per line
+        fields = ["timestamp", "hostname", "process", "pid", "message"]
+        return pd.DataFrame(dict(zip(fields, map(list, zip(*rows)))))
 
     def _parse_common_log_format(self, lines: List[str]) -> pd.DataFrame:
         """
@@ -990,40 +730,26 @@ class LogParser:
         Returns:
             pd.DataFrame: DataFrame containing the parsed log data
         """
-        data = []
-
-        # CLF pattern: host ident authuser [date] "request" status bytes
-        clf_pattern = r'^(\S+) (\S+) (\S+) \[([^]]+)\] "([^"]*)" (\d+) (\d+)$'
-
-        for line in lines:
-            match = re.match(clf_pattern, line.strip())
-            if match:
-                host, ident, authuser, date, request, status, bytes_sent = match.groups()
-
-                # Parse the request into method, path, and protocol
-                request_parts = request.split()
-                method = request_parts[0] if len(request_parts) > 0 else ""
-                path = request_parts[1] if len(request_parts) > 1 else ""
-                protocol = request_parts[2] if len(request_parts) > 2 else ""
-
-                # Add the data to the list
-                data.append({
-                    "host": host,
-                    "ident": ident,
-                    "authuser": authuser,
-                    "timestamp": date,
-                    "method": method,
-                    "path": path,
-                    "protocol": protocol,
-                    "status": status,
-                    "bytes_sent": bytes_sent,
-                    "url": path  # Add URL field for compatibility with browsing logs
-                })
-
-        # Create a DataFrame from the data
-        df = pd.DataFrame(data)
-
-        return df
+        rows = [match.groups() for match in map(config.LOG_TYPES["clf"].split_line, map(str.strip, lines)) if match]
+        if not rows:
+            return pd.DataFrame()
+        host, ident, authuser, date, request, status, bytes_sent = map(list, zip(*rows))
+
+        # Parse the request into method, path, and protocol, padding missing parts
+        method, path, protocol = map(list, zip(*((r.split() + ["", "", ""])[:3] for r in request)))
+
+        return pd.DataFrame({
+            "host": host,
+            "ident": ident,
+            "authuser": authuser,
+            "timestamp": date,
+            "method": method,
+            "path": path,
+            "protocol": protocol,
+            "status": status,
+            "bytes_sent": bytes_sent,
+            "url": path  # Add URL field for compatibility with browsing logs
+        })
 
     def _parse_extended_log_format(self, lines: List[str]) -> pd.DataFrame:
         """
@@ -1190,25 +916,12 @@ class LogParser:
         Returns:
             pd.DataFrame: DataFrame containing the parsed log data
         """
-        data = []
-
-        for line in lines:
-            # Split the line into parts
-            parts = line.strip().split(self.separator)
-
-            # Create a dictionary with the parts
-            row = {}
-            for i, part in enumerate(parts):
-                if i < len(self.columns):
-                    row[self.columns[i]] = part
-                else:
-                    # If there are more parts than columns, add them to the last column
-                    if self.columns:
-                        row[self.columns[-1]] = row.get(self.columns[-1], "") + " " + part
+        if self.parse_line is None:
+            return pd.DataFrame()
 
-            # Add the row to the data
-            if row:
-                data.append(row)
+        # The line parser leaves any parts beyond the last column in the last field
+        parse_line = self.parse_line
+        data = [parse_line(line.strip()) for line in lines]
 
         # Create a DataFrame from the data
         df = pd.DataFrame(data)
@@ -27,9 +27,7 @@ except ImportError:
 
 # Import cache settings from config
 from config import CACHE_DIR, CACHE_EXPIRATION, MAX_CACHE_SIZE
-
-# Create cache directory if it doesn't exist
-os.makedirs(CACHE_DIR, exist_ok=True)
+from utils import store_log_data
 
 def get_cache_key(file_path: str, log_type: str, **kwargs) -> str:
     """
@@ -465,7 +463,7 @@ def show_performance_dashboard():
                     dtypes_after = optimized_df.dtypes.value_counts()
 
                     # Update session state
-                    st.session_state.log_data = optimized_df
+                    store_log_data(optimized_df)
 
                     # Complete the progress
                     progress_bar.progress(100)
@@ -630,32 +628,45 @@ def optimized_detect_anomalies(df: pd.DataFrame, contamination: float = 0.05) ->
     # Detect anomalies
     return detect_anomalies(df, contamination)
 
+def _evict_if_over(max_bytes: int = MAX_CACHE_SIZE) -> None:
+    """
+    Remove the oldest cache files until the cache is back under 80% of max_bytes.
+
+    Sizes and modification times come from one os.scandir pass, whose entries carry
+    their stat results, instead of a getsize and a getmtime call per file.
+
+    Args:
+        max_bytes: Cache size budget in bytes
+    """
+    entries = []
+    with os.scandir(CACHE_DIR) as it:
+        for entry in it:
+            if entry.name.endswith('.pkl') and entry.is_file():
+                info = entry.stat()
+                entries.append((info.st_mtime, info.st_size, entry.path))
+
+    total_size = sum(size for _, size, _ in entries)
+    if total_size <= max_bytes:
+        return
+
+    # Oldest first, removing until we're under the limit (aim for 80% of max)
+    entries.sort()
+    for _, size, path in entries:
+        if total_size <= max_bytes * 0.8:
+            break
+        try:
+            os.remove(path)
+            total_size -= size
+        except Exception as e:
+            st.warning(f"Error removing cache file {path}: {e}")
+
 def manage_cache_size():
     """
     Manage cache size to prevent it from growing too large.
     Removes oldest cache files if total size exceeds MAX_CACHE_SIZE.
     """
     try:
-        # Get all cache files
-        cache_files = [os.path.join(CACHE_DIR, f) for f in os.listdir(CACHE_DIR) if f.endswith('.pkl')]
-
-        # Calculate total size
-        total_size = sum(os.path.getsize(f) for f in cache_files)
-
-        # If total size exceeds maximum, remove oldest files
-        if total_size > MAX_CACHE_SIZE and cache_files:
-            # Sort files by modification time (oldest first)
-            cache_files.sort(key=os.path.getmtime)
-
-            # Remove files until we're under the limit
-            while total_size > MAX_CACHE_SIZE * 0.8 and cache_files:  # Aim for 80% of max
-                file_to_remove = cache_files.pop(0)  # Remove oldest
-                file_size = os.path.getsize(file_to_remove)
-                try:
-                    os.remove(file_to_remove)
-                    total_size -= file_size
-                except Exception as e:
-                    st.warning(f"Error removing cache file {file_to_remove}: {e}")
+        _evict_if_over(MAX_CACHE_SIZE)
     except Exception as e:
         st.warning(f"Error managing cache size: {e}")
 
@@ -7,11 +7,9 @@ import threading
 import queue
 import pandas as pd
 from datetime import datetime
-import time
 import re
 from typing import Dict, List, Optional, Union, Any, Tuple, Generator
 
-from config import LOG_TYPES
 from log_parser import LogParser
 from utils import format_timestamp
 
@@ -49,7 +47,6 @@ def capture_logs() -> None:
     """
     for log in start_syslog_listener():
         log_queue.put(log)
-        time.sleep(0.1)  # Small delay to prevent CPU overuse
 
 def parse_syslog_message(message: str, log_type: str = "browsing") -> Dict[str, Any]:
     """
@@ -11,6 +11,9 @@ import ftplib
 from urllib.parse import urlparse
 from typing import Optional, Tuple, List, Dict, Any, BinaryIO, Union
 
+# Bytes written per chunk when streaming a download to disk
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
 class RemoteLogFetcher:
     """Class for fetching logs from remote systems."""
 
@@ -113,13 +116,15 @@ class RemoteLogFetcher:
         except Exception as e:
             return False, f"SSH error: {str(e)}", None
 
-    def _fetch_via_http(self, source_url: str, credentials: Optional[Dict[str, str]]) -> Tuple[bool, str, Optional[str]]:
+    def _fetch_via_http(self, source_url: str, credentials: Optional[Dict[str, str]],
+                        byte_range: Optional[Tuple[int, int]] = None) -> Tuple[bool, str, Optional[str]]:
         """
         Fetch a log file via HTTP/HTTPS.
 
         Args:
             source_url: HTTP URL (http://host/path/to/file)
             credentials: Dictionary with 'username' and 'password' for basic auth
+            byte_range: Optional inclusive (start, end) byte range to fetch instead of the whole file
 
         Returns:
             Tuple containing success flag, local path or error message, and content type
@@ -130,11 +135,14 @@ class RemoteLogFetcher:
             if credentials and 'username' in credentials and 'password' in credentials:
                 auth = (credentials['username'], credentials['password'])
 
+            # Only request the needed bytes when a range is given
+            headers = {'Range': f"bytes={byte_range[0]}-{byte_range[1]}"} if byte_range else None
+
             # Make the HTTP request
-            response = requests.get(source_url, auth=auth, stream=True, timeout=30)
+            response = requests.get(source_url, auth=auth, headers=headers, stream=True, timeout=30)
 
-            # Check if the request was successful
-            if response.status_code != 200:
+            # Check if the request was successful (206 for a served range request)
+            if response.status_code not in (200, 206):
                 return False, f"HTTP error: {response.status_code} - {response.reason}", None
 
             # Create a temporary file to store the log
@@ -142,7 +150,7 @@ class RemoteLogFetcher:
 
             # Save the content to the file
             with open(local_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     f.write(chunk)
 
             # Get the content type
@@ -211,7 +219,7 @@ class RemoteLogFetcher:
 
                 # Download the file
                 with open(local_path, 'wb') as f:
-                    ftp.retrbinary(f'RETR {path}', f.write)
+                    ftp.retrbinary(f'RETR {path}', f.write, blocksize=DOWNLOAD_CHUNK_SIZE)
 
                 ftp.quit()
 
@@ -316,7 +324,7 @@ class RemoteLogFetcher:
                 request_headers['Authorization'] = f"Bearer {api_key}"
 
             # Make the API request
-            response = requests.get(api_url, headers=request_headers, timeout=30)
+            response = requests.get(api_url, headers=request_headers, stream=True, timeout=30)
 
             # Check if the request was successful
             if response.status_code != 200:
@@ -325,9 +333,10 @@ class RemoteLogFetcher:
             # Create a temporary file to store the log
             local_path = os.path.join(self.temp_dir, "api_log.json")
 
-            # Save the content to the file
+            # Stream the content to the file instead of holding the whole body in memory
             with open(local_path, 'wb') as f:
-                f.write(response.content)
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
 
             # Get the content type
             content_type = response.headers.get('Content-Type', 'application/json')
@@ -367,7 +376,8 @@ def fetch_remote_log(source_type: str, source_params: Dict[str, Any]) -> Tuple[b
             source_params.get('url', ''),
             {'username': source_params.get('username', ''),
              'password': source_params.get('password', '')}
-            if source_params.get('username') else None
+            if source_params.get('username') else None,
+            source_params.get('byte_range')
         )
     elif source_type == 'ftp':
         return fetcher._fetch_via_ftp(
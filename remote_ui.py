@@ -158,10 +158,6 @@ def show_remote_fetch_ui() -> Optional[str]:
             status_text.text("Processing data...")
             progress_bar.progress(80)
 
-            # Small delay for visual feedback
-            import time
-            time.sleep(0.5)
-
             # Complete the progress
             progress_bar.progress(100)
             status_text.text("Completed!" if success else "Failed!")
@@ -1,7 +1,7 @@
 import streamlit as st
 import time
 
-from config import THEME_COLORS, DEFAULT_THEME
+from config import THEME_COLORS, DEFAULT_THEME, DARK_THEME
 from auth import check_session_validity
 
 # Try to import streamlit_option_menu, but make it optional
@@ -20,19 +20,19 @@ def configure_sidebar():
 
     # Get theme colors
     theme = st.session_state.get('theme', DEFAULT_THEME)
-    colors = THEME_COLORS.get(theme, THEME_COLORS['dark'])
+    colors = THEME_COLORS.get(theme, DARK_THEME)
 
     # Display app info
     with st.sidebar:
         st.markdown(f"""<div style='text-align: center; margin-bottom: 10px;'>
-            <h3 style='color: {colors['primary']}'>Log Analyser</h3>
-            <p style='color: {colors['text']}; font-size: 0.8em;'>Version 1.0.0</p>
+            <h3 style='color: {colors.primary}'>Log Analyser</h3>
+            <p style='color: {colors.text}; font-size: 0.8em;'>Version 1.0.0</p>
             </div>""", unsafe_allow_html=True)
 
         # Display current time
         current_time = time.strftime("%Y-%m-%d %H:%M:%S")
         st.markdown(f"""<div style='text-align: center; margin-bottom: 20px;'>
-            <p style='color: {colors['secondary']}; font-size: 0.7em;'>{current_time}</p>
+            <p style='color: {colors.secondary}; font-size: 0.7em;'>{current_time}</p>
             </div>""", unsafe_allow_html=True)
 
         # Configure navigation menu
@@ -73,25 +73,25 @@ def configure_sidebar():
                 styles={
                     "container": {
                         "padding": "0!important",
-                        "background-color": colors['background'],
-                        "color": colors['text'],
+                        "background-color": colors.background,
+                        "color": colors.text,
                         "width": "100%",
                         "display": "flex",
                         "flex-direction": "column",
                     },
-                    "icon": {"color": colors['primary'], "font-size": "1.2rem"},
+                    "icon": {"color": colors.primary, "font-size": "1.2rem"},
                     "nav-link": {
                         "font-size": "1rem",
                         "text-align": "left",
                         "margin": "10px 0",
                         "padding": "10px",
-                        "color": colors['text'],
-                        "--hover-color": colors['secondary'],
+                        "color": colors.text,
+                        "--hover-color": colors.secondary,
                         "border-radius": "5px",
                         "transition": "background-color 0.3s",
                     },
                     "nav-link-selected": {
-                        "background-color": colors['primary'],
+                        "background-color": colors.primary,
                         "color": "#ffffff",
                     },
                 },
@@ -109,8 +109,8 @@ def configure_sidebar():
         # Display user info if logged in
         if st.session_state.logged_in and st.session_state.username:
             st.markdown(f"""<div style='position: absolute; bottom: 20px; left: 10px; right: 10px; text-align: center;'>
-                <p style='color: {colors['text']}; font-size: 0.8em;'>Logged in as:</p>
-                <p style='color: {colors['primary']}; font-weight: bold;'>{st.session_state.username}</p>
+                <p style='color: {colors.text}; font-size: 0.8em;'>Logged in as:</p>
+                <p style='color: {colors.primary}; font-weight: bold;'>{st.session_state.username}</p>
                 </div>""", unsafe_allow_html=True)
 
     return selected
@@ -2,14 +2,56 @@
 Utility functions for the Log Analyzer application.
 """
 import os
+import numpy as np
 import pandas as pd
 import streamlit as st
 from datetime import datetime
 import hashlib
 import re
-from typing import Dict, List, Tuple, Optional, Any, Union
+import uuid
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple, Optional, Any, Union
+
+# Registry names (LOG_TYPES, ...) are read as config attributes, so the registry is built on first use
+import config
+from config import DEFAULT_LOG_TYPE
+
+# Try to import pyarrow, but make it optional
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Try to import numba, but make it optional
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Largest group x domain count matrix built densely; bigger splits fall back to groupby
+DENSE_PAIR_CELLS = 4_000_000
+
+# Columns holding IP addresses across the log types
+IP_COLUMNS = frozenset({'ip_address', 'src_ip', 'dst_ip', 'source_ip'})
+
+# HTTP status classes in code order (status // 100 - 1)
+STATUS_CLASSES = ['1xx', '2xx', '3xx', '4xx', '5xx']
+
+def status_class_categorical(status_codes: pd.Series) -> pd.Categorical:
+    """
+    Map HTTP status codes to their class (2xx, 3xx, ...) without a per-row Python call.
+
+    Args:
+        status_codes: Series of numeric HTTP status codes
 
-from config import LOG_TYPES, DEFAULT_LOG_TYPE
+    Returns:
+        pd.Categorical: Status classes; codes outside 100-599 become NaN
+    """
+    codes = pd.to_numeric(status_codes, errors='coerce').to_numpy(dtype=np.float64) // 100 - 1
+    valid = (codes >= 0) & (codes < len(STATUS_CLASSES))
+    return pd.Categorical.from_codes(np.where(valid, codes, -1).astype(np.int8), categories=STATUS_CLASSES)
 
 def detect_log_type(file_path: str) -> str:
     """
@@ -45,6 +87,23 @@ def detect_log_type(file_path: str) -> str:
         st.error(f"Error detecting log type: {e}")
         return DEFAULT_LOG_TYPE
 
+def log_type_for_columns(columns: Iterable[str]) -> Optional[str]:
+    """
+    Find the log type whose columns all appear among the given column names.
+
+    Each name is one lookup in COLUMN_TO_TYPES; a log type matches when every one of
+    its columns was seen. The most specific match (most columns) wins.
+
+    Args:
+        columns: Column names of a parsed DataFrame
+
+    Returns:
+        Optional[str]: Matching log type, or None if no log type's columns are all present
+    """
+    hits = Counter(name for column in set(columns) for name in config.COLUMN_TO_TYPES.get(column, ()))
+    matches = [name for name, count in hits.items() if count == len(config.LOG_TYPES[name].columns)]
+    return max(matches, key=lambda name: len(config.LOG_TYPES[name].columns)) if matches else None
+
 def format_timestamp(timestamp: Union[int, str], log_type: str = DEFAULT_LOG_TYPE) -> str:
     """
     Format a timestamp based on the log type.
@@ -65,9 +124,8 @@ def format_timestamp(timestamp: Union[int, str], log_type: str = DEFAULT_LOG_TYP
             dt = datetime.fromtimestamp(timestamp)
             return dt.strftime("%Y-%m-%d %H:%M:%S")
         else:
-            # Try to parse using the format specified in LOG_TYPES
-            dt_format = LOG_TYPES.get(log_type, {}).get("datetime_format", "%Y%m%d%H%M%S")
-            dt = datetime.strptime(timestamp, dt_format)
+            # Parse with the log type's timestamp parser, bound to its datetime format
+            dt = config.LOG_TYPES.get(log_type, config.UNKNOWN_LOG_TYPE).parse_timestamp(timestamp)
             return dt.strftime("%Y-%m-%d %H:%M:%S")
     except Exception:
         # Return the original timestamp if parsing fails
@@ -110,18 +168,22 @@ def get_human_readable_size(size_bytes: Union[int, str]) -> str:
     except (ValueError, TypeError):
         return str(size_bytes)
 
-def get_time_periods(df: pd.DataFrame, timestamp_col: str = 'timestamp') -> Dict[str, pd.DataFrame]:
+# Look-back window of each named time period ("All Time" has none)
+TIME_PERIOD_OFFSETS = {
+    "Last Hour": pd.Timedelta(hours=1),
+    "Last Day": pd.Timedelta(days=1),
+    "Last Week": pd.Timedelta(weeks=1),
+    "Last Month": pd.Timedelta(days=30),
+}
+
+def _add_datetime_column(df: pd.DataFrame, timestamp_col: str) -> None:
     """
-    Split a DataFrame into different time periods for analysis.
+    Parse a timestamp column into the DataFrame's 'datetime' column in place.
 
     Args:
         df: DataFrame containing log data
         timestamp_col: Name of the timestamp column
-
-    Returns:
-        Dict: Dictionary with time periods as keys and filtered DataFrames as values
     """
-    # Ensure timestamp column is datetime
     try:
         # First try to convert as numeric (Unix timestamp)
         if pd.api.types.is_numeric_dtype(df[timestamp_col]):
@@ -133,9 +195,9 @@ def get_time_periods(df: pd.DataFrame, timestamp_col: str = 'timestamp') -> Dict
                 df['datetime'] = pd.to_datetime(df[timestamp_col].astype(float), unit='s')
             else:
                 # Try with format from config if available
-                from config import LOG_TYPES
                 log_type = st.session_state.get('log_type', 'browsing')
-                datetime_format = LOG_TYPES.get(log_type, {}).get('datetime_format')
+                spec = config.LOG_TYPES.get(log_type)
+                datetime_format = spec.datetime_format if spec else None
 
                 if datetime_format:
                     df['datetime'] = pd.to_datetime(df[timestamp_col], format=datetime_format, errors='coerce')
@@ -147,24 +209,94 @@ def get_time_periods(df: pd.DataFrame, timestamp_col: str = 'timestamp') -> Dict
         # Create a default datetime column to avoid errors
         df['datetime'] = pd.Timestamp.now()
 
-    # Create time period filters
-    now = pd.Timestamp.now()
-    last_hour = now - pd.Timedelta(hours=1)
-    last_day = now - pd.Timedelta(days=1)
-    last_week = now - pd.Timedelta(weeks=1)
-    last_month = now - pd.Timedelta(days=30)
+def get_time_periods(df: pd.DataFrame, timestamp_col: str = 'timestamp') -> Dict[str, pd.DataFrame]:
+    """
+    Split a DataFrame into different time periods for analysis.
+
+    Args:
+        df: DataFrame containing log data
+        timestamp_col: Name of the timestamp column
+
+    Returns:
+        Dict: Dictionary with time periods as keys and filtered DataFrames as values
+    """
+    # Ensure timestamp column is datetime
+    _add_datetime_column(df, timestamp_col)
 
     # Create filtered DataFrames
-    periods = {
-        "Last Hour": df[df['datetime'] >= last_hour],
-        "Last Day": df[df['datetime'] >= last_day],
-        "Last Week": df[df['datetime'] >= last_week],
-        "Last Month": df[df['datetime'] >= last_month],
-        "All Time": df
-    }
+    now = pd.Timestamp.now()
+    periods = {period: df[df['datetime'] >= now - offset] for period, offset in TIME_PERIOD_OFFSETS.items()}
+    periods["All Time"] = df
 
     return periods
 
+def get_time_period_slice(df: pd.DataFrame, period: str, timestamp_col: str = 'timestamp') -> pd.DataFrame:
+    """
+    Get the rows of a DataFrame that fall in a single named time period.
+
+    Unlike get_time_periods, only the requested period is materialized.
+
+    Args:
+        df: DataFrame containing log data
+        period: Time period name ("Last Hour", "Last Day", ..., "All Time")
+        timestamp_col: Name of the timestamp column
+
+    Returns:
+        pd.DataFrame: Rows from the period (df itself for "All Time" or an unknown period)
+    """
+    # Ensure timestamp column is datetime
+    _add_datetime_column(df, timestamp_col)
+
+    offset = TIME_PERIOD_OFFSETS.get(period)
+    if offset is None:
+        return df
+
+    cutoff = pd.Timestamp.now() - offset
+    datetimes = df['datetime']
+    if datetimes.is_monotonic_increasing:
+        # Sorted logs: binary search for the first row in the period
+        return df.iloc[datetimes.searchsorted(cutoff):]
+    return df[datetimes >= cutoff]
+
+def store_log_data(df: Optional[pd.DataFrame]) -> None:
+    """
+    Store log data in session state and bump its version.
+
+    Args:
+        df: DataFrame to store, or None to clear the log data
+    """
+    st.session_state.log_data = df
+    st.session_state.log_data_version = st.session_state.get('log_data_version', 0) + 1
+
+def _session_token() -> str:
+    """
+    Random token identifying the current session, created on first use.
+
+    Returns:
+        str: Hex token kept in session state
+    """
+    if 'session_token' not in st.session_state:
+        st.session_state.session_token = uuid.uuid4().hex
+    return st.session_state.session_token
+
+def frame_identity(df: pd.DataFrame) -> Tuple[str, int, int, Tuple[int, int]]:
+    """
+    Cheap cache key for a DataFrame held in session state.
+
+    Streamlit caches are shared by every session in the process, so the key starts
+    with a per-session token: object ids are reused once a frame is freed, and the
+    log data version alone restarts at 1 in each session. Within a session, the
+    version keeps keys distinct when a new DataFrame reuses the id and shape of
+    one that was replaced.
+
+    Args:
+        df: DataFrame to identify
+
+    Returns:
+        Tuple: Session token, log data version, object id and shape of the DataFrame
+    """
+    return _session_token(), st.session_state.get('log_data_version', 0), id(df), df.shape
+
 def create_download_link(df: pd.DataFrame, filename: str = "data.csv") -> str:
     """
     Create a download link for a DataFrame.
@@ -187,42 +319,40 @@ def optimize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     Optimize a DataFrame's memory usage by downcasting numeric types and
     converting object types to categories when appropriate.
 
+    Remaining high-cardinality text columns become Arrow-backed strings when
+    pyarrow is installed.
+
     Args:
         df: DataFrame to optimize
 
     Returns:
         pd.DataFrame: Memory-optimized DataFrame
     """
-    # Make a copy to avoid modifying the original DataFrame
-    result = df.copy()
-
-    # Process each column
-    for col in result.columns:
-        # Skip datetime columns
-        if pd.api.types.is_datetime64_any_dtype(result[col]):
-            continue
-
-        # Downcast numeric columns
-        if pd.api.types.is_numeric_dtype(result[col]):
-            # Integers
-            if pd.api.types.is_integer_dtype(result[col]):
-                # Check if column can be represented as unsigned int
-                if result[col].min() >= 0:
-                    result[col] = pd.to_numeric(result[col], downcast='unsigned')
-                else:
-                    result[col] = pd.to_numeric(result[col], downcast='integer')
-            # Floats
-            elif pd.api.types.is_float_dtype(result[col]):
-                result[col] = pd.to_numeric(result[col], downcast='float')
-
-        # Convert object columns to category if they have few unique values
-        elif pd.api.types.is_object_dtype(result[col]):
-            # Calculate unique ratio (unique values / total values)
-            unique_ratio = result[col].nunique() / len(result)
-
-            # If less than 50% unique values, convert to category
-            if unique_ratio < 0.5:
-                result[col] = result[col].astype('category')
+    # Shallow copy: every converted column is assigned, never written in place,
+    # so the original DataFrame is left untouched without duplicating its data
+    result = df.copy(deep=False)
+
+    # Downcast integers, to unsigned types when there are no negative values
+    for col in result.select_dtypes(include='integer').columns:
+        downcast = 'unsigned' if result[col].min() >= 0 else 'integer'
+        result[col] = pd.to_numeric(result[col], downcast=downcast)
+
+    # Downcast floats
+    for col in result.select_dtypes(include='float').columns:
+        result[col] = pd.to_numeric(result[col], downcast='float')
+
+    # Convert text columns to category if less than 50% of their values are unique,
+    # so value_counts/groupby work on integer codes instead of hashing strings.
+    # IP address columns always do: they are counted on every page, and the codes
+    # are their fixed-width integer form, mapped back to dotted quads per unique only
+    n_rows = max(len(result), 1)
+    for col in result.select_dtypes(include=['object', 'string']).columns:
+        if col in IP_COLUMNS or result[col].nunique(dropna=False) / n_rows < 0.5:
+            result[col] = result[col].astype('category')
+        elif (PYARROW_AVAILABLE and result[col].dtype == object
+              and pd.api.types.infer_dtype(result[col], skipna=True) == 'string'):
+            # Contiguous Arrow buffers instead of one Python object per value
+            result[col] = result[col].astype('string[pyarrow]')
 
     return result
 
@@ -248,6 +378,69 @@ def get_dataframe_memory_usage(df: pd.DataFrame) -> str:
     else:
         return f"{memory_bytes/(1024**3):.2f} GB"
 
+# Domain of a URL, skipping the scheme and a leading "www."
+DOMAIN_PATTERN = re.compile(r'https?://(?:www\.)?([^/]+)')
+
+def _pair_counts_numpy(group_codes: np.ndarray, domain_codes: np.ndarray,
+                       n_groups: int, n_domains: int) -> np.ndarray:
+    """
+    Count (group, domain) code pairs into an n_groups x n_domains matrix.
+
+    Args:
+        group_codes: Non-negative group code of each visit
+        domain_codes: Non-negative domain code of each visit
+        n_groups: Number of groups
+        n_domains: Number of domains
+
+    Returns:
+        np.ndarray: int32 visit counts indexed by [group, domain]
+    """
+    flat = group_codes.astype(np.int64) * n_domains + domain_codes
+    return np.bincount(flat, minlength=n_groups * n_domains).astype(np.int32).reshape(n_groups, n_domains)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _pair_counts(group_codes, domain_codes, n_groups, n_domains):
+        out = np.zeros((n_groups, n_domains), np.int32)
+        for i in range(group_codes.size):
+            out[group_codes[i], domain_codes[i]] += 1
+        return out
+else:
+    _pair_counts = _pair_counts_numpy
+
+def _top_domains_by_group(domain: pd.Series, groups: pd.Series, n: int) -> Dict[Any, Dict[str, int]]:
+    """
+    Count domains within each group and keep the n most visited per group.
+
+    Args:
+        domain: Domain of each visit
+        groups: Group (category, user, ...) of each visit
+        n: Number of domains to keep per group
+
+    Returns:
+        Dict: Group mapped to its top domains and their visit counts, in first-seen group order
+    """
+    group_codes, group_names = pd.factorize(groups, sort=False)
+    domain_codes, domain_names = pd.factorize(domain, sort=False)
+    n_groups, n_domains = len(group_names), len(domain_names)
+
+    if n_groups * n_domains > DENSE_PAIR_CELLS:
+        counts = domain.groupby(groups, observed=True, sort=False).value_counts()
+        top = {}
+        for (group, name), count in counts.groupby(level=0, sort=False).head(n).items():
+            top.setdefault(group, {})[name] = int(count)
+        return top
+
+    valid = (group_codes >= 0) & (domain_codes >= 0)
+    matrix = _pair_counts(group_codes[valid].astype(np.int32), domain_codes[valid].astype(np.int32),
+                          n_groups, n_domains)
+    top = {}
+    for code, group in enumerate(group_names):
+        row = matrix[code]
+        best = np.argsort(-row, kind='stable')[:n]
+        top[group] = {domain_names[i]: int(row[i]) for i in best if row[i] > 0}
+    return top
+
 def extract_domain_from_url(url: str) -> str:
     """
     Extract the domain from a URL.
@@ -259,7 +452,7 @@ def extract_domain_from_url(url: str) -> str:
         str: Domain name
     """
     # Simple regex to extract domain
-    domain_match = re.search(r'https?://(?:www\.)?([^/]+)', url)
+    domain_match = DOMAIN_PATTERN.search(url)
     if domain_match:
         return domain_match.group(1)
     return "unknown"
@@ -277,34 +470,28 @@ def analyze_site_visits(df: pd.DataFrame) -> Dict:
     results = {}
 
     if 'url' in df.columns:
-        # Extract domains
-        df['domain'] = df['url'].apply(extract_domain_from_url)
+        # Extract domains in one vectorized regex pass (same pattern as extract_domain_from_url)
+        domain = df['url'].str.extract(DOMAIN_PATTERN, expand=False).fillna("unknown")
 
-        # Top visited domains
-        top_domains = df['domain'].value_counts().head(10).to_dict()
+        # Top visited domains, selected without sorting every domain
+        top_domains = domain.value_counts(sort=False).nlargest(10).to_dict()
         results['top_domains'] = top_domains
 
-        # Visits by category if available
+        # Visits by category if available (left unsorted; the chart orders its bars)
         if 'category' in df.columns:
-            category_visits = df['category'].value_counts().to_dict()
+            category_visits = df['category'].value_counts(sort=False).to_dict()
             results['category_visits'] = category_visits
 
-            # Top domains by category
-            top_domains_by_category = {}
-            for category in df['category'].unique():
-                category_df = df[df['category'] == category]
-                top_domains_by_category[category] = category_df['domain'].value_counts().head(5).to_dict()
-            results['top_domains_by_category'] = top_domains_by_category
+            # Top domains by category, from one grouped count instead of a mask per category
+            results['top_domains_by_category'] = _top_domains_by_group(domain, df['category'], 5)
 
         # Visits by user if available
         if 'username' in df.columns:
-            user_visits = {}
-            for user in df['username'].unique():
-                user_df = df[df['username'] == user]
-                user_visits[user] = {
-                    'total_visits': len(user_df),
-                    'top_domains': user_df['domain'].value_counts().head(5).to_dict()
-                }
-            results['user_visits'] = user_visits
+            user_totals = df.groupby('username', observed=True, sort=False).size()
+            user_top_domains = _top_domains_by_group(domain, df['username'], 5)
+            results['user_visits'] = {
+                user: {'total_visits': int(total), 'top_domains': user_top_domains.get(user, {})}
+                for user, total in user_totals.items()
+            }
 
     return results